@@ -1,5 +1,6 @@
 import phonenumbers
 from phonenumbers import geocoder, carrier, timezone
+from functools import lru_cache
 
 
 def analyze_phone_number(phone_number):
@@ -12,6 +13,18 @@ def analyze_phone_number(phone_number):
     Returns:
         dict: Dictionary containing country, carrier, and timezone information
     """
+    # Build a fresh dict each call so callers can't mutate the cached result
+    return dict(_analyze_cached(phone_number))
+
+
+@lru_cache(maxsize=4096)
+def _analyze_cached(phone_number):
+    """
+    Does the actual lookups for analyze_phone_number; repeated numbers hit the cache.
+
+    Returns:
+        tuple: Immutable (key, value) pairs of the analysis result
+    """
     try:
         # Parse the phone number
         parsed_number = phonenumbers.parse(phone_number, None)
@@ -28,16 +41,16 @@ def analyze_phone_number(phone_number):
         # Get timezone information
         time_zones = timezone.time_zones_for_number(parsed_number)
 
-        return {
-            "valid": True,
-            "number": phonenumbers.format_number(parsed_number, phonenumbers.PhoneNumberFormat.INTERNATIONAL),
-            "country": country,
-            "carrier": service_provider,
-            "timezone": time_zones[0] if time_zones else "Unknown",
-            "country_code": parsed_number.country_code
-        }
+        return (
+            ("valid", True),
+            ("number", phonenumbers.format_number(parsed_number, phonenumbers.PhoneNumberFormat.INTERNATIONAL)),
+            ("country", country),
+            ("carrier", service_provider),
+            ("timezone", time_zones[0] if time_zones else "Unknown"),
+            ("country_code", parsed_number.country_code)
+        )
     except phonenumbers.phonenumberutil.NumberParseException:
-        return {"valid": False, "error": "Invalid phone number format"}
+        return (("valid", False), ("error", "Invalid phone number format"))
 
 
 def main():
@@ -1,14 +1,41 @@
 import csv
+import json
+import re
 from enum import Enum
 from datetime import datetime, timedelta
 import os
-from typing import List, Dict, Optional
-import pickle
+import sys
+import time
+from typing import List, Dict, Optional, Tuple
+import orjson
 from abc import ABC, abstractmethod
-import json
+import atexit
+from collections import defaultdict
+from bisect import bisect_left, insort
 
 #------------------------------------------
 
+# Once the mutation journal grows past this many bytes it is folded back into the snapshot
+JOURNAL_COMPACT_SIZE = 256 * 1024
+
+# Exports are written through a buffer this large so a big list costs a handful of write calls
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Where orjson's output can differ from json.dump's: raw characters past '~' (json.dump writes
+# \uXXXX escapes), exponents (orjson writes 1e16, json.dump 1e+16) and small floats (0.00001, not 1e-05)
+# The exponent check is a literal-prefixed pattern so the scan stays fast; a false hit only costs the slow path
+_JSON_EXPONENT = re.compile(rb'e[-+0-9]')
+# Every string and every float; matching whole strings keeps digits inside them untouched
+_JSON_COMPAT_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+(?:e[-+]?\d+)?|e[-+]?\d+)')
+
+
+def _json_compat_token(token) -> bytes:
+    # Re-encode the token exactly as json.dump would write it
+    text = token[0]
+    if text[:1] == b'"':
+        return text if text.isascii() and b'\x7f' not in text else json.dumps(orjson.loads(text)).encode()
+    return repr(float(text)).encode()
+
 
 class Priority(Enum):
     HIGH = "High"
@@ -17,13 +44,20 @@ class Priority(Enum):
 
     @classmethod
     def from_string(cls, value: str):
-        for priority in cls:
-            if priority.value == value:
-                return priority
-        raise ValueError(f"Invalid priority: {value}")
+        try:
+            return cls._VALUE_MAP[value]
+        except KeyError:
+            raise ValueError(f"Invalid priority: {value}") from None
+
+
+# Lookup tables built once here rather than by iterating the enum on every call
+Priority._VALUE_MAP = {priority.value: priority for priority in Priority}
+_PRIORITY_LIST = tuple(Priority)
 
 
 class Category:
+    __slots__ = ('name', 'color')
+
     def __init__(self, name: str, color: str = "#FFFFFF"):
         self.name = name
         self.color = color
@@ -38,8 +72,27 @@ class Category:
     def from_dict(cls, data: Dict):
         return cls(data['name'], data.get('color', "#FFFFFF"))
 
+    def __setstate__(self, state):
+        _restore_slots(self, state)
+
+
+def _restore_slots(obj, state):
+    # Pickles written before __slots__ carry a plain attribute dict, slotted ones a (None, slots) pair
+    if isinstance(state, tuple):
+        state = state[1]
+    for key, value in state.items():
+        setattr(obj, key, value)
+
+
+def _from_timestamp(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value) if value is not None else None
+
 
 class Task:
+    # Slots keep each task small and make the attribute reads in filter/statistics scans cheaper
+    __slots__ = ('name', 'description', 'priority', 'due_ts', 'category',
+                 'completed', 'created_at', 'completed_at', '_str_cache')
+
     def __init__(self,
                  name: str,
                  description: str = "",
@@ -49,6 +102,7 @@ class Task:
                  completed: bool = False,
                  created_at: Optional[datetime] = None,
                  completed_at: Optional[datetime] = None):
+        self._str_cache = None
         self.name = name
         self.description = description
         self.priority = priority
@@ -59,52 +113,101 @@ class Task:
         self.completed_at = completed_at
 
     def __str__(self):
-        status = "✅" if self.completed else "⏳"
-        priority_str = f" | Priority: {self.priority.value}" if self.priority else ""
-        category_str = f" | Category: {self.category.name}" if self.category else ""
-        due_date_str = f" | Due: {self.due_date.strftime('%Y-%m-%d %H:%M')}" if self.due_date else ""
-        return f"{status} Name: {self.name} | Desc: {self.description}{priority_str}{category_str}{due_date_str}"
+        # Views print the same tasks again and again; the line is only rebuilt after a change
+        # (anything that modifies a task resets _str_cache)
+        if self._str_cache is None:
+            status = "✅" if self.completed else "⏳"
+            priority_str = f" | Priority: {self.priority.value}" if self.priority else ""
+            category_str = f" | Category: {self.category.name}" if self.category else ""
+            due_date_str = f" | Due: {self.due_date.strftime('%Y-%m-%d %H:%M')}" if self.due_ts is not None else ""
+            self._str_cache = f"{status} Name: {self.name} | Desc: {self.description}{priority_str}{category_str}{due_date_str}"
+        return self._str_cache
 
     def to_dict(self):
         return {
             'name': self.name,
             'description': self.description,
             'priority': self.priority.name if self.priority else None,
-            'due_date': self.due_date.timestamp() if self.due_date else None,
+            'due_date': self.due_ts,
             'category': self.category.to_dict() if self.category else None,
             'completed': self.completed,
             'created_at': self.created_at.timestamp(),
             'completed_at': self.completed_at.timestamp() if self.completed_at else None
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict):
+        return cls(
+            name=data['name'],
+            description=data.get('description', ""),
+            priority=Priority[data['priority']] if data.get('priority') else None,
+            due_date=_from_timestamp(data.get('due_date')),
+            category=Category.from_dict(data['category']) if data.get('category') else None,
+            completed=data.get('completed', False),
+            created_at=_from_timestamp(data.get('created_at')),
+            completed_at=_from_timestamp(data.get('completed_at'))
+        )
+
+    def __setstate__(self, state):
+        self._str_cache = None
+        _restore_slots(self, state)
+
+    # The due date is kept as epoch seconds so overdue checks are plain float compares;
+    # the datetime is only built when something displays or edits it
+    @property
+    def due_date(self) -> Optional[datetime]:
+        return _from_timestamp(self.due_ts)
+
+    @due_date.setter
+    def due_date(self, value: Optional[datetime]):
+        self.due_ts = value.timestamp() if value else None
+        self._str_cache = None
+
     def complete(self):
         self.completed = True
         self.completed_at = datetime.now()
+        self._str_cache = None
 
-    def is_overdue(self) -> bool:
-        return not self.completed and self.due_date and datetime.now() > self.due_date
+    # Callers scanning many tasks pass one shared `now` instead of reading the clock per task
+    def is_overdue(self, now_ts: Optional[float] = None) -> bool:
+        if self.completed or self.due_ts is None:
+            return False
+        return (now_ts if now_ts is not None else time.time()) > self.due_ts
 
-    def days_until_due(self) -> Optional[int]:
-        if self.due_date:
-            return (self.due_date - datetime.now()).days
+    def days_until_due(self, now: Optional[datetime] = None) -> Optional[int]:
+        if self.due_ts is not None:
+            return (self.due_date - (now or datetime.now())).days
         return None
 
 
-class TaskFilter(ABC):
-    @abstractmethod
+class TaskFilter:
+    # A plain base class rather than an ABC: views only ever call the bound filter methods
+    __slots__ = ()
+
+    # Rough planning estimates: relative cost of one check, and the share of tasks it rejects
+    COST = 1.0
+    SELECTIVITY = 0.5
+
     def filter(self, task: Task) -> bool:
-        pass
+        raise NotImplementedError
 
 
 class PriorityFilter(TaskFilter):
+    __slots__ = ('priority',)
+    SELECTIVITY = 2 / 3
+
     def __init__(self, priority: Priority):
         self.priority = priority
 
     def filter(self, task: Task) -> bool:
-        return task.priority == self.priority
+        return task.priority is self.priority
 
 
 class CategoryFilter(TaskFilter):
+    __slots__ = ('category',)
+    COST = 2.0
+    SELECTIVITY = 0.75
+
     def __init__(self, category: Category):
         self.category = category
 
@@ -113,6 +216,8 @@ class CategoryFilter(TaskFilter):
 
 
 class CompletedFilter(TaskFilter):
+    __slots__ = ('completed',)
+
     def __init__(self, completed: bool):
         self.completed = completed
 
@@ -121,19 +226,121 @@ class CompletedFilter(TaskFilter):
 
 
 class OverdueFilter(TaskFilter):
+    __slots__ = ('now_ts',)
+    COST = 2.0
+    SELECTIVITY = 0.8
+
+    def __init__(self, now: Optional[datetime] = None):
+        self.now_ts = now.timestamp() if now else time.time()
+
     def filter(self, task: Task) -> bool:
-        return task.is_overdue()
+        return task.is_overdue(self.now_ts)
+
+
+class FilterChain(TaskFilter):
+    """Matches tasks that pass every filter, so a view needs one pass instead of one list per filter"""
+    __slots__ = ('filters', 'satisfiable', 'predicate')
+
+    def __init__(self, filters: List[TaskFilter]):
+        simplified = self._simplify(filters)
+        self.satisfiable = simplified is not None
+        # Cheap, highly selective checks first so most tasks are dropped before the expensive ones run
+        self.filters = tuple(sorted(simplified or (), key=lambda task_filter: task_filter.COST / task_filter.SELECTIVITY))
+        # A single filter's bound method is used as-is, saving a call per task
+        checks = tuple(task_filter.filter for task_filter in self.filters)
+        if not self.satisfiable:
+            self.predicate = _never
+        elif len(checks) == 1:
+            self.predicate = checks[0]
+        else:
+            self.predicate = _all_of(checks)
+
+    @staticmethod
+    def _simplify(filters: List[TaskFilter]) -> Optional[List[TaskFilter]]:
+        """Drop duplicate and implied filters; returns None when no task could pass them all"""
+        kept: Dict[type, tuple] = {}
+        others = []
+        for task_filter in filters:
+            kind = type(task_filter)
+            if kind is PriorityFilter:
+                value = task_filter.priority
+            elif kind is CategoryFilter:
+                value = task_filter.category.name
+            elif kind is CompletedFilter:
+                value = task_filter.completed
+            elif kind is OverdueFilter:
+                value = None
+            else:
+                others.append(task_filter)
+                continue
+
+            if kind in kept:
+                if kept[kind][0] != value:
+                    return None
+                continue
+            kept[kind] = (value, task_filter)
+
+        # Overdue already implies pending
+        if OverdueFilter in kept and CompletedFilter in kept:
+            if kept[CompletedFilter][0]:
+                return None
+            del kept[CompletedFilter]
+
+        return [task_filter for _, task_filter in kept.values()] + others
+
+    def filter(self, task: Task) -> bool:
+        return self.predicate(task)
+
+
+def _never(task: Task) -> bool:
+    return False
+
+
+def _all_of(checks):
+    def matches(task: Task) -> bool:
+        for check in checks:
+            if not check(task):
+                return False
+        return True
+    return matches
 
 
 class TaskStatistics:
-    def __init__(self, tasks: List[Task]):
+    _PRIORITY_INDEX = {priority: i for i, priority in enumerate(_PRIORITY_LIST)}
+
+    def __init__(self, tasks: List[Task], completion_order: Optional[List[Tuple[float, int]]] = None):
         self.tasks = tasks
+        # (completed_at timestamp, position) pairs kept sorted by ToDoList, if available
+        self.completion_order = completion_order
+
+        try:
+            import numpy as np
+        except ImportError:
+            np = None  # No NumPy; each method below loops over the tasks instead
+        self._np = np
+        if np is None:
+            return
+
+        # Copy the fields the statistics read into flat arrays once, so every
+        # method below is a NumPy reduction rather than another pass over Task objects.
+        # Missing dates become NaN (never matches a comparison), missing priority the extra last bin.
+        n = len(tasks)
+        no_priority = len(_PRIORITY_LIST)
+        self._completed = np.fromiter((task.completed for task in tasks), dtype=bool, count=n)
+        self._due_ts = np.fromiter((task.due_ts if task.due_ts is not None else np.nan
+                                    for task in tasks), dtype=np.float64, count=n)
+        self._completed_ts = np.fromiter((task.completed_at.timestamp() if task.completed_at else np.nan
+                                          for task in tasks), dtype=np.float64, count=n)
+        self._priority_idx = np.fromiter((self._PRIORITY_INDEX.get(task.priority, no_priority)
+                                          for task in tasks), dtype=np.uint8, count=n)
 
     def total_tasks(self) -> int:
         return len(self.tasks)
 
     def completed_tasks(self) -> int:
-        return sum(1 for task in self.tasks if task.completed)
+        if self._np is None:
+            return sum(task.completed for task in self.tasks)
+        return int(self._completed.sum())
 
     def completion_percentage(self) -> float:
         if not self.tasks:
@@ -141,19 +348,32 @@ class TaskStatistics:
         return (self.completed_tasks() / self.total_tasks()) * 100
 
     def tasks_by_priority(self) -> Dict[Priority, int]:
-        counts = {priority: 0 for priority in Priority}
-        for task in self.tasks:
-            if task.priority in counts:
-                counts[task.priority] += 1
-        return counts
+        if self._np is None:
+            counts = [0] * len(_PRIORITY_LIST)
+            for task in self.tasks:
+                index = self._PRIORITY_INDEX.get(task.priority)
+                if index is not None:
+                    counts[index] += 1
+        else:
+            counts = self._np.bincount(self._priority_idx, minlength=len(_PRIORITY_LIST) + 1)
+        return {priority: int(count) for priority, count in zip(_PRIORITY_LIST, counts)}
 
     def overdue_tasks(self) -> int:
-        return sum(1 for task in self.tasks if task.is_overdue())
+        now_ts = time.time()
+        if self._np is None:
+            return sum(task.is_overdue(now_ts) for task in self.tasks)
+        return int((~self._completed & (self._due_ts < now_ts)).sum())
 
     def recently_completed(self, days: int = 7) -> List[Task]:
-        cutoff = datetime.now() - timedelta(days=days)
-        return [task for task in self.tasks
-                if task.completed and task.completed_at and task.completed_at >= cutoff]
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
+        if self.completion_order is not None:
+            start = bisect_left(self.completion_order, (cutoff_ts,))
+            return [self.tasks[position] for position in sorted(position for _, position in self.completion_order[start:])]
+        if self._np is None:
+            return [task for task in self.tasks
+                    if task.completed and task.completed_at and task.completed_at.timestamp() >= cutoff_ts]
+        recent = self._completed & (self._completed_ts >= cutoff_ts)
+        return [self.tasks[i] for i in self._np.flatnonzero(recent)]
 
 
 class TaskExporter(ABC):
@@ -164,91 +384,220 @@ class TaskExporter(ABC):
 
 class CSVExporter(TaskExporter):
     def export(self, tasks: List[Task], filename: str):
-        with open(filename, mode='w', newline='', encoding='utf-8') as file:
+        with open(filename, mode='w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as file:
             writer = csv.DictWriter(file, fieldnames=[
                 'name', 'description', 'priority', 'due_date',
                 'category', 'completed', 'created_at', 'completed_at'
             ])
             writer.writeheader()
-            for task in tasks:
-                writer.writerow(task.to_dict())
+            writer.writerows([task.to_dict() for task in tasks])
 
 
 class JSONExporter(TaskExporter):
     def export(self, tasks: List[Task], filename: str):
-        with open(filename, mode='w', encoding='utf-8') as file:
-            json.dump([task.to_dict() for task in tasks], file, indent=2)
+        # orjson builds the whole document in one go, still indented for readability. Tasks are
+        # handed over as-is and turned into dicts one at a time through `default`, so the export
+        # never holds a second full copy of the list as dicts
+        with open(filename, mode='wb', buffering=EXPORT_BUFFER_SIZE) as file:
+            data = orjson.dumps(tasks, default=Task.to_dict, option=orjson.OPT_INDENT_2)
+            if (not data.isascii() or b'\x7f' in data or b'0.0000' in data
+                    or _JSON_EXPONENT.search(data)):
+                # Rewrite the few tokens json.dump formats differently, so exports keep their old form
+                data = _JSON_COMPAT_TOKEN.sub(_json_compat_token, data)
+            file.write(data)
 
 
 class TextExporter(TaskExporter):
     def export(self, tasks: List[Task], filename: str):
-        with open(filename, mode='w', encoding='utf-8') as file:
-            for task in tasks:
-                file.write(str(task) + "\n")
+        with open(filename, mode='w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as file:
+            file.write("".join(f"{task}\n" for task in tasks))
+
+
+def print_numbered(title: str, items):
+    # One write for the whole listing instead of a print() per line
+    sys.stdout.write(f"\n{title}\n" + "".join(f"{i}. {item}\n" for i, item in enumerate(items, 1)))
 
 
 class ToDoList:
     def __init__(self, data_dir='todo_data'): # If you don't want to save the data, set this value to NONE.
-        self.tasks: List[Task] = []
-        self.categories: List[Category] = []
+        # Tasks as read from disk (dicts, plus Task objects added since); see the tasks property
+        self._task_records: Optional[list] = []
+        self._tasks: Optional[List[Task]] = None
+        self._categories: List[Category] = []
         self.data_dir = data_dir
-        os.makedirs(data_dir, exist_ok=True)
+        self._loaded = False
+        self._journal = None
+        # Bumped on every compaction; the snapshot and the journal header both carry it, so journal
+        # records already folded into the snapshot are recognised and skipped on load
+        self._generation = 0
+        # Task positions keyed by the fields the common filters test, so those views skip the full scan
+        self._by_priority: Dict[Priority, set] = defaultdict(set)
+        self._by_category: Dict[str, set] = defaultdict(set)
+        self._by_completed: Dict[bool, set] = defaultdict(set)
+        self._completion_order: List[Tuple[float, int]] = []
+        # Nothing touches the disk until the tasks or categories are first needed
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        os.makedirs(self.data_dir, exist_ok=True)
         self.load_data()
 
+        # Each mutation appends one JSON line here instead of rewriting the whole state file
+        self._journal = open(os.path.join(self.data_dir, 'state.journal'), 'ab', buffering=64 * 1024)
+        atexit.register(self.close)
+        if self._journal.tell() == 0:
+            self._start_journal()
+        if self._journal.tell() > JOURNAL_COMPACT_SIZE:
+            self.compact()
+
+    @property
+    def categories(self) -> List[Category]:
+        self._ensure_loaded()
+        return self._categories
+
+    @property
+    def tasks(self) -> List[Task]:
+        self._ensure_loaded()
+        # Task objects are only built the first time something reads the list,
+        # so a session that just adds a task never pays for the rest
+        if self._tasks is None:
+            self._tasks = [record if isinstance(record, Task) else Task.from_dict(record)
+                           for record in self._task_records]
+            self._task_records = None
+            self._reindex()
+        return self._tasks
+
     def add_task(self, task: Task):
-        self.tasks.append(task)
-        self.save_data()
+        self._ensure_loaded()
+        if self._tasks is None:
+            self._task_records.append(task)
+        else:
+            self._tasks.append(task)
+            self._index(len(self._tasks) - 1)
+        self._record('add_task', task.to_dict())
 
     def remove_task(self, index: int) -> Optional[Task]:
-        if 0 <= index < len(self.tasks):
-            removed_task = self.tasks.pop(index)
-            self.save_data()
+        tasks = self.tasks
+        if 0 <= index < len(tasks):
+            self._unindex(index)
+            # Tasks are listed in storage order, so the later ones keep their order and move up one
+            removed_task = tasks.pop(index)
+            self._close_gap(index)
+            self._record('remove_task', index)
             return removed_task
         return None
 
     def complete_task(self, index: int) -> bool:
         if 0 <= index < len(self.tasks):
-            self.tasks[index].complete()
-            self.save_data()
+            task = self.tasks[index]
+            self._unindex(index)
+            task.complete()
+            self._index(index)
+            self._record('set_task', index, task.to_dict())
             return True
         return False
 
     def edit_task(self, index: int, **kwargs):
         if 0 <= index < len(self.tasks):
             task = self.tasks[index]
+            self._unindex(index)
             for key, value in kwargs.items():
                 if hasattr(task, key):
                     setattr(task, key, value)
-            self.save_data()
+            task._str_cache = None
+            self._index(index)
+            self._record('set_task', index, task.to_dict())
             return True
         return False
 
+    def _index(self, position: int):
+        task = self.tasks[position]
+        self._by_completed[task.completed].add(position)
+        if task.priority:
+            self._by_priority[task.priority].add(position)
+        if task.category:
+            self._by_category[task.category.name].add(position)
+        if task.completed and task.completed_at:
+            insort(self._completion_order, (task.completed_at.timestamp(), position))
+
+    def _unindex(self, position: int):
+        task = self.tasks[position]
+        self._by_completed[task.completed].discard(position)
+        if task.priority:
+            self._by_priority[task.priority].discard(position)
+        if task.category:
+            self._by_category[task.category.name].discard(position)
+        if task.completed and task.completed_at:
+            entry = (task.completed_at.timestamp(), position)
+            i = bisect_left(self._completion_order, entry)
+            if i < len(self._completion_order) and self._completion_order[i] == entry:
+                del self._completion_order[i]
+
+    def _close_gap(self, removed: int):
+        # Every indexed position after the removed one moves down by one; relative order is unchanged
+        for index in (self._by_priority, self._by_category, self._by_completed):
+            for key, positions in index.items():
+                index[key] = {position - (position > removed) for position in positions}
+        self._completion_order[:] = [(ts, position - (position > removed))
+                                     for ts, position in self._completion_order]
+
+    def _reindex(self):
+        self._by_priority.clear()
+        self._by_category.clear()
+        self._by_completed.clear()
+        self._completion_order.clear()
+        for position in range(len(self.tasks)):
+            self._index(position)
+
+    def _indexed_lookup(self, filters: Tuple[TaskFilter, ...]) -> Optional[List[Task]]:
+        # Answer from the indexes when every filter is an indexed one; None means a scan is needed
+        matches = []
+        for task_filter in filters:
+            kind = type(task_filter)
+            if kind is PriorityFilter:
+                matches.append(self._by_priority.get(task_filter.priority, set()))
+            elif kind is CategoryFilter:
+                matches.append(self._by_category.get(task_filter.category.name, set()))
+            elif kind is CompletedFilter:
+                matches.append(self._by_completed.get(task_filter.completed, set()))
+            else:
+                return None
+        smallest, *rest = sorted(matches, key=len)
+        return [self.tasks[position] for position in sorted(smallest.intersection(*rest))]
+
     def view_tasks(self, filters: Optional[List[TaskFilter]] = None):
         filtered_tasks = self.tasks
         if filters:
-            for task_filter in filters:
-                filtered_tasks = [task for task in filtered_tasks if task_filter.filter(task)]
+            chain = FilterChain(filters)
+            if not chain.satisfiable:
+                filtered_tasks = []
+            else:
+                filtered_tasks = self._indexed_lookup(chain.filters)
+                if filtered_tasks is None:
+                    matches = chain.predicate
+                    filtered_tasks = [task for task in self.tasks if matches(task)]
 
         if not filtered_tasks:
             print("No tasks found.")
             return
 
-        print("\nTask List:")
-        for i, task in enumerate(filtered_tasks, 1):
-            print(f"{i}. {task}")
+        print_numbered("Task List:", filtered_tasks)
 
     def add_category(self, category: Category):
         self.categories.append(category)
-        self.save_data()
+        self._record('add_category', category.to_dict())
 
     def remove_category(self, index: int) -> Optional[Category]:
         if 0 <= index < len(self.categories):
             removed_category = self.categories.pop(index)
             # Remove this category from all tasks
-            for task in self.tasks:
-                if task.category and task.category.name == removed_category.name:
-                    task.category = None
-            self.save_data()
+            tasks = self.tasks
+            for position in self._by_category.pop(removed_category.name, ()):
+                tasks[position].category = None
+                tasks[position]._str_cache = None
+            self._record('remove_category', index)
             return removed_category
         return None
 
@@ -257,40 +606,150 @@ class ToDoList:
             print("No categories defined.")
             return
 
-        print("\nCategories:")
-        for i, category in enumerate(self.categories, 1):
-            print(f"{i}. {category}")
+        print_numbered("Categories:", self.categories)
 
     def get_statistics(self) -> TaskStatistics:
-        return TaskStatistics(self.tasks)
+        return TaskStatistics(self.tasks, self._completion_order)
 
     def export_tasks(self, exporter: TaskExporter, filename: str):
         exporter.export(self.tasks, filename)
         print(f"Tasks successfully exported to {filename}")
 
-    def save_data(self):
-        # Save tasks
-        with open(os.path.join(self.data_dir, 'tasks.pkl'), 'wb') as f:
-            pickle.dump(self.tasks, f)
+    def _record(self, op: str, *args):
+        # Nothing is recorded while load_data is replaying the journal
+        if self._journal is None:
+            return
+        self._journal.write(orjson.dumps([op, *args]) + b"\n")
+        self._journal.flush()
+        if self._journal.tell() > JOURNAL_COMPACT_SIZE:
+            self.compact()
+
+    def compact(self):
+        """Fold the journal into a fresh snapshot and empty it"""
+        self._ensure_loaded()
+        # The snapshot is durable under the new generation before the journal is emptied. A crash
+        # in between leaves a journal from the old generation, which load_data then discards
+        self._generation += 1
+        self._write_snapshot()
+        self._journal.seek(0)
+        self._journal.truncate()
+        self._start_journal()
+
+    def _start_journal(self):
+        # The first line of the journal says which snapshot its records apply to
+        self._journal.write(orjson.dumps(['generation', self._generation]) + b"\n")
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    def close(self):
+        if self._journal is not None and not self._journal.closed:
+            self._journal.close()
+
+    # Every mutation is already flushed to disk, so only the data directory needs to cross a
+    # process boundary; the receiving side reloads from there instead of unpickling every task
+    def __getstate__(self):
+        return {'data_dir': self.data_dir}
+
+    def __setstate__(self, state):
+        self.__init__(state['data_dir'])
 
-        # Save categories
-        with open(os.path.join(self.data_dir, 'categories.pkl'), 'wb') as f:
-            pickle.dump(self.categories, f)
+    def save_data(self):
+        """Write everything to a fresh snapshot now"""
+        # Goes through compact so the journal is restarted with the snapshot; a snapshot written
+        # under the journal's own generation would get that journal replayed onto it again
+        self.compact()
+
+    def _write_snapshot(self):
+        if self._tasks is None:
+            tasks = [record.to_dict() if isinstance(record, Task) else record for record in self._task_records]
+        else:
+            tasks = [task.to_dict() for task in self._tasks]
+        state = {
+            'generation': self._generation,
+            'tasks': tasks,
+            'categories': [category.to_dict() for category in self._categories]
+        }
+        # Write to a temp file first so a crash never leaves a half-written snapshot
+        path = os.path.join(self.data_dir, 'state.json')
+        with open(path + '.tmp', 'wb') as f:
+            f.write(orjson.dumps(state))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + '.tmp', path)
+        if hasattr(os, 'O_DIRECTORY'):
+            # Make the rename itself durable too (POSIX only; Windows can't open a directory)
+            dir_fd = os.open(self.data_dir, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
 
     def load_data(self):
-        # Load tasks
+        try:
+            with open(os.path.join(self.data_dir, 'state.json'), 'rb') as f:
+                state = orjson.loads(f.read())
+            self._task_records = state['tasks']
+            self._categories = [Category.from_dict(category) for category in state['categories']]
+            self._generation = state.get('generation', 0)
+        except FileNotFoundError:
+            self._load_legacy_pickles()
+        self._tasks = None
+
+        # Replay the mutations recorded since the last snapshot
+        try:
+            with open(os.path.join(self.data_dir, 'state.journal'), 'r+b') as f:
+                journal = f.read()
+                end = journal.rfind(b"\n") + 1
+                records = journal[:end].splitlines()
+                # Journals from before generations were recorded have no header and belong to generation 0
+                generation = 0
+                if records and records[0].startswith(b'["generation",'):
+                    generation = orjson.loads(records.pop(0))[1]
+                if generation != self._generation:
+                    # A compaction stopped after swapping in the snapshot; these records are already in it
+                    records = []
+                    f.truncate(0)
+                elif end < len(journal):
+                    # Drop a record torn by a crash mid-write so later appends stay readable
+                    f.truncate(end)
+        except FileNotFoundError:
+            return
+        for line in records:
+            self._replay(*orjson.loads(line))
+
+    def _replay(self, op: str, *args):
+        # Applied to the raw task dicts so loading doesn't build any Task objects
+        if op == 'add_task':
+            self._task_records.append(args[0])
+        elif op == 'set_task':
+            self._task_records[args[0]] = args[1]
+        elif op == 'remove_task':
+            del self._task_records[args[0]]
+        elif op == 'add_category':
+            self._categories.append(Category.from_dict(args[0]))
+        elif op == 'remove_category':
+            removed_category = self._categories.pop(args[0])
+            for record in self._task_records:
+                if record['category'] and record['category']['name'] == removed_category.name:
+                    record['category'] = None
+
+    def _load_legacy_pickles(self):
+        # Older versions pickled tasks and categories separately; convert them to state.json once
+        import pickle
         try:
             with open(os.path.join(self.data_dir, 'tasks.pkl'), 'rb') as f:
-                self.tasks = pickle.load(f)
+                self._task_records = [task.to_dict() for task in pickle.load(f)]
         except (FileNotFoundError, EOFError):
-            self.tasks = []
+            self._task_records = []
 
-        # Load categories
         try:
             with open(os.path.join(self.data_dir, 'categories.pkl'), 'rb') as f:
-                self.categories = pickle.load(f)
+                self._categories = pickle.load(f)
         except (FileNotFoundError, EOFError):
-            self.categories = []
+            self._categories = []
+
+        if self._task_records or self._categories:
+            self._write_snapshot()
 
 
 def display_menu():
@@ -314,7 +773,7 @@ def get_priority_input() -> Priority:
         try:
             choice = int(input("Select priority (1-3): "))
             if 1 <= choice <= 3:
-                return list(Priority)[choice - 1]
+                return _PRIORITY_LIST[choice - 1]
             print("Please enter a number between 1 and 3.")
         except ValueError:
             print("Please enter a valid number.")
@@ -408,9 +867,8 @@ def view_statistics(todo_list: ToDoList):
 
     recent_completed = stats.recently_completed()
     if recent_completed:
-        print(f"\nRecently completed tasks (last 7 days): {len(recent_completed)}")
-        for task in recent_completed:
-            print(f"- {task.name} (completed on {task.completed_at.strftime('%Y-%m-%d')})")
+        sys.stdout.write(f"\nRecently completed tasks (last 7 days): {len(recent_completed)}\n" + "".join(
+            f"- {task.name} (completed on {task.completed_at.strftime('%Y-%m-%d')})\n" for task in recent_completed))
 
 
 def export_tasks_menu(todo_list: ToDoList):
@@ -476,9 +934,7 @@ def main():
             elif filter_choice == '7':
                 recent_tasks = todo_list.get_statistics().recently_completed()
                 if recent_tasks:
-                    print("\nRecently Completed Tasks:")
-                    for i, task in enumerate(recent_tasks, 1):
-                        print(f"{i}. {task}")
+                    print_numbered("Recently Completed Tasks:", recent_tasks)
                     continue
                 else:
                     print("No recently completed tasks.")
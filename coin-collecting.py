@@ -1,7 +1,33 @@
+import math
 import pygame
 import random
 import sys
+import threading
+from collections import OrderedDict
 from typing import List, Tuple
+import numpy as np
+
+# pygame-ce is a drop-in replacement for pygame; when it's the one installed, use its
+# compiled geometry primitives for the coin test and fall back to plain Python otherwise
+if getattr(pygame, "IS_CE", False):
+    try:
+        from pygame.geometry import Circle
+    except ImportError:
+        Circle = None
+else:
+    Circle = None
+
+# Numba is optional: with it the particle step runs as one compiled loop, without it NumPy does it
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Bound once so the per-frame input and timer code skips the module attribute lookups
+_K_LEFT = pygame.K_LEFT
+_K_RIGHT = pygame.K_RIGHT
+_ticks = pygame.time.get_ticks
+_get_pressed = pygame.key.get_pressed
 
 #---------------------------------
 
@@ -12,7 +38,13 @@ pygame.init()
 # Screen dimensions
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 800
-main_screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+# Double-buffered, scaled display synced to the monitor; vsync isn't available on every
+# driver, so fall back to the same display without it. The display has to exist before the
+# sprites below are created, since they're converted to its pixel format for fast blits.
+try:
+    main_screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF | pygame.SCALED, vsync=1)
+except pygame.error:
+    main_screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF | pygame.SCALED)
 pygame.display.set_caption("Coin Collector")
 
 # Colors
@@ -37,13 +69,140 @@ PLAYING = 1
 GAME_OVER = 2
 SETTINGS = 3
 
+# Power-up types, which index POWERUP_COLORS and POWERUP_SURFS
+SHIELD = 0
+SPEED_BOOST = 1
+EXTRA_LIFE = 2
+POWERUP_COLORS = (CYAN, ORANGE, GREEN)
+
+# Upper bound on live particles; bursts beyond it are simply not spawned
+MAX_PARTICLES = 1024
+
+# Game logic advances in fixed steps of FRAME_MS; after a long stall at most
+# MAX_CATCH_UP_STEPS are run before drawing again so the game can't spiral behind
+FPS = 60
+FRAME_MS = 1000 / FPS
+MAX_CATCH_UP_STEPS = 5
+
+# Obstacle and coin fall speeds and positions are 16.16 fixed-point integers (value << FX_SHIFT),
+# so the per-frame step is an integer add and the pixel row is a shift
+FX_SHIFT = 16
+OBSTACLE_SPEEDUP_FX = round(0.3 * (1 << FX_SHIFT))
+COIN_SPEEDUP_FX = round(0.2 * (1 << FX_SHIFT))
+
+# How many rendered text surfaces Game keeps around; changing scores evict the oldest
+TEXT_CACHE_SIZE = 64
+
+PLAYER_SIZE = 50
+POWERUP_SIZE = 30
+COIN_RADIUS = 15
+# Room around the player sprite for the shield ring; the box sits this far in from its corner
+PLAYER_SPRITE_PAD = 10
+# Largest pulse a coin grows by; a sprite is pre-rendered for every offset up to it
+MAX_COIN_PULSE = 6
+# Coin pulse offset per animation frame (masked to 0-63): two full sine cycles of 0..MAX_COIN_PULSE
+_PULSE = [int(MAX_COIN_PULSE / 2 * math.sin(i * 4 * math.pi / 64) + MAX_COIN_PULSE / 2) for i in range(64)]
+
+
+#---------------------------------
+# Pre-rendered sprites: each entity look is drawn once here and blitted every frame
+
+
+def _make_coin_surf(radius: int, color: Tuple[int, int, int]) -> pygame.Surface:
+    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (radius, radius), radius)
+    pygame.draw.circle(surf, BLACK, (radius, radius), radius, 1)
+    return surf.convert_alpha()
+
+
+def _make_player_surf(shield: bool, speed_boost: bool) -> pygame.Surface:
+    size = PLAYER_SIZE
+    pad = PLAYER_SPRITE_PAD
+    surf = pygame.Surface((size + pad * 2, size + pad * 2), pygame.SRCALPHA)
+    pygame.draw.rect(surf, BLUE, (pad, pad, size, size))
+    if shield:
+        pygame.draw.circle(surf, CYAN, (pad + size // 2, pad + size // 2), size // 2 + 10, 2)
+    if speed_boost:
+        pygame.draw.rect(surf, ORANGE, (pad - 5, pad - 5, size + 10, size + 10), 2)
+    return surf.convert_alpha()
+
+
+def _draw_shield_icon(surf: pygame.Surface, size: int) -> None:
+    pygame.draw.circle(surf, WHITE, (size // 2, size // 2), 10, 2)
+
+
+def _draw_speed_boost_icon(surf: pygame.Surface, size: int) -> None:
+    pygame.draw.line(surf, WHITE, (5, size // 2), (size - 5, size // 2), 3)
+    pygame.draw.polygon(surf, WHITE, [
+        (size - 5, size // 2),
+        (size - 15, size // 2 - 5),
+        (size - 15, size // 2 + 5)
+    ])
+
+
+def _draw_extra_life_icon(surf: pygame.Surface, size: int) -> None:
+    pygame.draw.polygon(surf, WHITE, [
+        (size // 2, 5),
+        (5, size - 5),
+        (size - 5, size - 5)
+    ])
+
+
+# Icon painters indexed by power-up type
+_POWERUP_ICONS = (_draw_shield_icon, _draw_speed_boost_icon, _draw_extra_life_icon)
+
+
+def _make_power_up_surf(kind: int) -> pygame.Surface:
+    size = POWERUP_SIZE
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.rect(surf, POWERUP_COLORS[kind], (0, 0, size, size))
+    _POWERUP_ICONS[kind](surf, size)
+    return surf.convert_alpha()
+
+
+# Coin sprites by colour, then by pulse offset
+COIN_SURFS = {
+    color: [_make_coin_surf(COIN_RADIUS + offset, color) for offset in range(MAX_COIN_PULSE + 1)]
+    for color in (GOLD, PURPLE)
+}
+# Player sprites keyed by (shield, speed_boost)
+PLAYER_SURFS = {(shield, boost): _make_player_surf(shield, boost)
+                for shield in (False, True) for boost in (False, True)}
+POWERUP_SURFS = tuple(_make_power_up_surf(kind) for kind in range(len(POWERUP_COLORS)))
+
+# Obstacle bars by width and particle discs by (colour, radius), filled in as they're first needed
+_OBSTACLE_SURFS = {}
+_PARTICLE_SURFS = {}
+
+
+def obstacle_surf(width: int, height: int) -> pygame.Surface:
+    surf = _OBSTACLE_SURFS.get((width, height))
+    if surf is None:
+        surf = _OBSTACLE_SURFS[width, height] = pygame.Surface((width, height)).convert()
+        surf.fill(RED)
+    return surf
+
+
+def particle_surf(color: Tuple[int, int, int], radius: int) -> pygame.Surface:
+    key = (color, radius)
+    surf = _PARTICLE_SURFS.get(key)
+    if surf is None:
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, color, (radius, radius), radius)
+        surf = _PARTICLE_SURFS[key] = surf.convert_alpha()
+    return surf
+
 #---------------------------------
 
 
 class Player:
+    __slots__ = ('width', 'height', '_right_bound', 'x', 'y', 'right', 'bottom', 'speed', 'color',
+                 'shield', 'shield_time', 'speed_boost', 'speed_boost_time')
+
     def __init__(self):
-        self.width = 50
-        self.height = 50
+        self.width = PLAYER_SIZE
+        self.height = PLAYER_SIZE
+        self._right_bound = SCREEN_WIDTH - self.width
         self.reset_position()
         self.speed = 10
         self.color = BLUE
@@ -55,29 +214,27 @@ class Player:
     def reset_position(self):
         self.x = SCREEN_WIDTH // 2 - self.width // 2
         self.y = SCREEN_HEIGHT - self.height - 10
+        # Box edges, kept up to date as the player moves so collision checks just read them
+        self.right = self.x + self.width
+        self.bottom = self.y + self.height
 
-    def draw(self, surface: pygame.Surface) -> None:
-        pygame.draw.rect(surface, self.color, (self.x, self.y, self.width, self.height))
-
-        if self.shield:
-            shield_radius = self.width // 2 + 10
-            pygame.draw.circle(surface, CYAN,
-                               (self.x + self.width // 2, self.y + self.height // 2),
-                               shield_radius, 2)
+    def sprite(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        return (PLAYER_SURFS[self.shield, self.speed_boost],
+                (self.x - PLAYER_SPRITE_PAD, self.y - PLAYER_SPRITE_PAD))
 
-        if self.speed_boost:
-            pygame.draw.rect(surface, ORANGE, (self.x - 5, self.y - 5,
-                                               self.width + 10, self.height + 10), 2)
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        return surface.blit(*self.sprite())
 
     def update(self, keys: pygame.key.ScancodeWrapper) -> None:
         speed_multiplier = 1.5 if self.speed_boost else 1
+        speed_i = int(self.speed * speed_multiplier)
 
-        if keys[pygame.K_LEFT] and self.x > 0:
-            self.x -= int(self.speed * speed_multiplier)
-        if keys[pygame.K_RIGHT] and self.x < SCREEN_WIDTH - self.width:
-            self.x += int(self.speed * speed_multiplier)
+        # Move by the net key direction and clamp to the screen in one expression
+        dx = (keys[_K_RIGHT] - keys[_K_LEFT]) * speed_i
+        self.x = max(0, min(self._right_bound, self.x + dx))
+        self.right = self.x + self.width
 
-        current_time = pygame.time.get_ticks()
+        current_time = _ticks()
         if self.shield and current_time - self.shield_time > 5000:
             self.shield = False
         if self.speed_boost and current_time - self.speed_boost_time > 5000:
@@ -85,22 +242,35 @@ class Player:
 
 
 class Obstacle:
+    __slots__ = ('width', 'height', 'x', 'y', 'y_fx', 'bottom', 'rect', 'surf', 'speed_fx', 'color')
+
     def __init__(self):
         self.width = random.randint(100, 200)
         self.height = 20
         self.reset_position()
-        self.speed = 5
+        self.speed_fx = 5 << FX_SHIFT
         self.color = RED
 
     def reset_position(self):
         self.x = random.randint(0, SCREEN_WIDTH - self.width)
         self.y = -self.height
+        self.y_fx = self.y << FX_SHIFT
+        self.bottom = self.y + self.height
+        # Kept in step with x/y so collisions can be tested in one Rect.collidelistall call
+        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.surf = obstacle_surf(self.width, self.height)
 
-    def draw(self, surface: pygame.Surface) -> None:
-        pygame.draw.rect(surface, self.color, (self.x, self.y, self.width, self.height))
+    def sprite(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        return self.surf, (self.x, self.y)
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        return surface.blit(*self.sprite())
 
     def update(self) -> None:
-        self.y += self.speed
+        self.y_fx += self.speed_fx
+        self.y = self.y_fx >> FX_SHIFT
+        self.bottom = self.y + self.height
+        self.rect.y = self.y
 
     def is_off_screen(self) -> bool:
         return self.y > SCREEN_HEIGHT
@@ -108,14 +278,16 @@ class Obstacle:
     def respawn(self) -> None:
         self.width = random.randint(100, 200)
         self.reset_position()
-        self.speed += 0.3
+        self.speed_fx += OBSTACLE_SPEEDUP_FX
 
 
 class Coin:
+    __slots__ = ('radius', 'x', 'y', 'y_fx', 'speed_fx', 'color', 'collected', 'animation_frame', 'value')
+
     def __init__(self):
-        self.radius = 15
+        self.radius = COIN_RADIUS
         self.reset_position()
-        self.speed = 4
+        self.speed_fx = 4 << FX_SHIFT
         self.color = GOLD
         self.collected = False
         self.animation_frame = 0
@@ -124,15 +296,19 @@ class Coin:
     def reset_position(self):
         self.x = random.randint(self.radius, SCREEN_WIDTH - self.radius)
         self.y = -self.radius
+        self.y_fx = self.y << FX_SHIFT
 
-    def draw(self, surface: pygame.Surface) -> None:
-        pulse_offset = int(2 * abs(pygame.math.Vector2(1, self.animation_frame * 0.1).x))
+    def sprite(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        pulse_offset = _PULSE[self.animation_frame & 63]
         pulse_radius = self.radius + pulse_offset
-        pygame.draw.circle(surface, self.color, (self.x, self.y), pulse_radius)
-        pygame.draw.circle(surface, BLACK, (self.x, self.y), pulse_radius, 1)
+        return COIN_SURFS[self.color][pulse_offset], (self.x - pulse_radius, self.y - pulse_radius)
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        return surface.blit(*self.sprite())
 
     def update(self) -> None:
-        self.y += self.speed
+        self.y_fx += self.speed_fx
+        self.y = self.y_fx >> FX_SHIFT
         self.animation_frame += 1
 
     def is_off_screen(self) -> bool:
@@ -140,7 +316,7 @@ class Coin:
 
     def respawn(self) -> None:
         self.reset_position()
-        self.speed += 0.2
+        self.speed_fx += COIN_SPEEDUP_FX
         self.collected = False
         if random.random() < 0.1:
             self.color = PURPLE
@@ -151,80 +327,150 @@ class Coin:
 
 
 class PowerUp:
+    __slots__ = ('width', 'height', 'x', 'y', 'bottom', 'rect', 'speed', 'type', 'collected', 'color')
+
     def __init__(self):
-        self.width = 30
-        self.height = 30
+        self.width = POWERUP_SIZE
+        self.height = POWERUP_SIZE
         self.reset_position()
         self.speed = 3
-        self.type = random.choice(["shield", "speed_boost", "extra_life"])
+        self.type = random.randrange(len(POWERUP_COLORS))
         self.collected = False
         self.set_color()
 
     def reset_position(self):
         self.x = random.randint(0, SCREEN_WIDTH - self.width)
         self.y = -self.height
+        self.bottom = self.y + self.height
+        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
 
     def set_color(self):
-        self.color = {
-            "shield": CYAN,
-            "speed_boost": ORANGE,
-            "extra_life": GREEN
-        }[self.type]
-
-    def draw(self, surface: pygame.Surface) -> None:
-        pygame.draw.rect(surface, self.color, (self.x, self.y, self.width, self.height))
-
-        if self.type == "shield":
-            pygame.draw.circle(surface, WHITE, (self.x + self.width // 2, self.y + self.height // 2), 10, 2)
-        elif self.type == "speed_boost":
-            pygame.draw.line(surface, WHITE, (self.x + 5, self.y + self.height // 2),
-                             (self.x + self.width - 5, self.y + self.height // 2), 3)
-            pygame.draw.polygon(surface, WHITE, [
-                (self.x + self.width - 5, self.y + self.height // 2),
-                (self.x + self.width - 15, self.y + self.height // 2 - 5),
-                (self.x + self.width - 15, self.y + self.height // 2 + 5)
-            ])
-        else:
-            pygame.draw.polygon(surface, WHITE, [
-                (self.x + self.width // 2, self.y + 5),
-                (self.x + 5, self.y + self.height - 5),
-                (self.x + self.width - 5, self.y + self.height - 5)
-            ])
+        self.color = POWERUP_COLORS[self.type]
+
+    def sprite(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        return POWERUP_SURFS[self.type], (self.x, self.y)
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        return surface.blit(*self.sprite())
 
     def update(self) -> None:
         self.y += self.speed
+        self.bottom = self.y + self.height
+        self.rect.y = self.y
 
     def is_off_screen(self) -> bool:
         return self.y > SCREEN_HEIGHT
 
     def respawn(self) -> None:
         self.reset_position()
-        self.type = random.choice(["shield", "speed_boost", "extra_life"])
+        self.type = random.randrange(len(POWERUP_COLORS))
         self.collected = False
         self.set_color()
 
 
-class Particle:
-    def __init__(self, x: int, y: int, color: Tuple[int, int, int]):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.size = random.randint(2, 5)
-        self.speed_x = random.uniform(-2, 2)
-        self.speed_y = random.uniform(-5, -1)
-        self.lifetime = random.randint(20, 40)
+def _step_particles(x, y, speed_x, speed_y, size, lifetime, color, n):
+    """
+    Moves, shrinks and ages the first n particles and compacts the survivors to the front,
+    all in one pass over the arrays. Returns how many particles are still alive.
+    """
+    live = 0
+    for i in range(n):
+        if lifetime[i] <= 1:
+            continue
+        x[live] = x[i] + speed_x[i]
+        y[live] = y[i] + speed_y[i]
+        speed_x[live] = speed_x[i]
+        speed_y[live] = speed_y[i]
+        size[live] = size[i] - 0.1 if size[i] > 0.1 else 0.0
+        lifetime[live] = lifetime[i] - 1
+        color[live, 0] = color[i, 0]
+        color[live, 1] = color[i, 1]
+        color[live, 2] = color[i, 2]
+        live += 1
+    return live
+
+
+# The explicit signature makes Numba compile at import, before the menu, rather than on the first
+# frame of the first game (which could stall it for seconds without a cached build)
+_step_particles_jit = njit(
+    "int64(float32[::1], float32[::1], float32[::1], float32[::1], float32[::1], int16[::1], uint8[:, ::1], int64)",
+    cache=True, fastmath=True
+)(_step_particles) if njit is not None else None
+
+
+class ParticleSystem:
+    """
+    All live particles stored as parallel NumPy arrays (one per field) rather than one object each,
+    so a frame steps every particle with a handful of vectorized operations.
+    The first `count` entries of each array are the live particles.
+    """
+
+    def __init__(self, capacity: int = MAX_PARTICLES):
+        self.x = np.empty(capacity, dtype=np.float32)
+        self.y = np.empty(capacity, dtype=np.float32)
+        self.speed_x = np.empty(capacity, dtype=np.float32)
+        self.speed_y = np.empty(capacity, dtype=np.float32)
+        self.size = np.empty(capacity, dtype=np.float32)
+        self.lifetime = np.empty(capacity, dtype=np.int16)
+        self.color = np.empty((capacity, 3), dtype=np.uint8)
+        self.count = 0
+        self._rng = np.random.default_rng()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def spawn(self, x: int, y: int, color: Tuple[int, int, int], amount: int) -> None:
+        start = self.count
+        end = min(start + amount, len(self.x))
+        n = end - start
+        if n <= 0:
+            return
+
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.color[start:end] = color
+        rng = self._rng
+        self.size[start:end] = rng.integers(2, 6, n)
+        self.speed_x[start:end] = rng.uniform(-2, 2, n)
+        self.speed_y[start:end] = rng.uniform(-5, -1, n)
+        self.lifetime[start:end] = rng.integers(20, 41, n)
+        self.count = end
 
     def update(self) -> None:
-        self.x += self.speed_x
-        self.y += self.speed_y
-        self.lifetime -= 1
-        self.size = max(0, self.size - 0.1)
-
-    def draw(self, surface: pygame.Surface) -> None:
-        pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), int(self.size))
-
-    def is_dead(self) -> bool:
-        return self.lifetime <= 0
+        n = self.count
+        if _step_particles_jit is not None:
+            self.count = _step_particles_jit(self.x, self.y, self.speed_x, self.speed_y,
+                                             self.size, self.lifetime, self.color, n)
+            return
+
+        self.x[:n] += self.speed_x[:n]
+        self.y[:n] += self.speed_y[:n]
+        self.lifetime[:n] -= 1
+        np.maximum(self.size[:n] - 0.1, 0, out=self.size[:n])
+
+        # Compact the survivors to the front of every array
+        alive = self.lifetime[:n] > 0
+        if not alive.all():
+            live = int(alive.sum())
+            for field in (self.x, self.y, self.speed_x, self.speed_y, self.size, self.lifetime, self.color):
+                field[:live] = field[:n][alive]
+            self.count = live
+
+    def sprites(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """(disc surface, top-left) for every particle that still has a visible radius"""
+        n = self.count
+        return [(particle_surf(tuple(color), size), (x - size, y - size))
+                for x, y, size, color in zip(self.x[:n].astype(np.int32).tolist(),
+                                             self.y[:n].astype(np.int32).tolist(),
+                                             self.size[:n].astype(np.int32).tolist(),
+                                             self.color[:n].tolist())
+                if size > 0]
+
+    def draw(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        return surface.blits(self.sprites())
 
 
 class Game:
@@ -234,13 +480,29 @@ class Game:
         self.obstacles: List[Obstacle] = []
         self.coins: List[Coin] = []
         self.power_ups: List[PowerUp] = []
-        self.particles: List[Particle] = []
+        # Power-ups that left play, reused by spawn_power_up instead of allocating new ones
+        self._power_up_pool: List[PowerUp] = []
+        self.particles = ParticleSystem()
         self.score = 0
         self.high_score = self.load_high_score()
         self.level = 1
         self.lives = 1
         self.dark_mode = True
         self.clock = pygame.time.Clock()
+        # High-score writes happen off the main thread, one at a time
+        self._save_lock = threading.Lock()
+        self._save_thread = None
+        # Screen areas drawn during the last PLAYING frame, and which (state, theme) is on screen
+        self._dirty_rects: List[pygame.Rect] = []
+        self._drawn_screen = None
+        # Rendered text keyed by (font, text, color), least recently used first
+        self._text_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        # Labels whose text and colour never change are rendered once up front
+        self._menu_title = TITLE_FONT.render("COIN COLLECTOR", True, GOLD)
+        self._settings_title = TITLE_FONT.render("SETTINGS", True, GOLD)
+        self._game_over_title = GAME_OVER_FONT.render("GAME OVER", True, RED)
+        self._shield_label = NORMAL_FONT.render("SHIELD", True, CYAN)
+        self._speed_label = NORMAL_FONT.render("SPEED BOOST", True, ORANGE)
         self.reset_game_objects()
 
     @staticmethod
@@ -252,52 +514,74 @@ class Game:
             return 0
 
     def save_high_score(self) -> None:
-        with open("highscore.txt", "w", encoding="utf-8") as f:
-            f.write(str(self.high_score))
+        """Writes the high score on a background thread so the game-over frame doesn't wait on disk"""
+        self._save_thread = threading.Thread(target=self._save_high_score_blocking, daemon=True)
+        self._save_thread.start()
+
+    def _save_high_score_blocking(self) -> None:
+        # Read the score under the lock so whichever writer runs last writes the newest value
+        with self._save_lock:
+            with open("highscore.txt", "w", encoding="utf-8") as f:
+                f.write(str(self.high_score))
 
     def reset_game_objects(self):
         self.obstacles = [Obstacle() for _ in range(min(3 + self.level // 2, 5))]
         self.coins = [Coin() for _ in range(min(2 + self.level // 3, 5))]
+        self._power_up_pool.extend(self.power_ups)
         self.power_ups = []
-        self.particles = []
+        self.particles.clear()
 
     def spawn_power_up(self) -> None:
         if random.random() < 0.05 and len(self.power_ups) < 2:
-            self.power_ups.append(PowerUp())
+            if self._power_up_pool:
+                power_up = self._power_up_pool.pop()
+                power_up.respawn()
+            else:
+                power_up = PowerUp()
+            self.power_ups.append(power_up)
 
     def check_collisions(self) -> None:
-        # Check coin collisions
+        player = self.player
+        player_rect = pygame.Rect(player.x, player.y, player.width, player.height)
+        left, top, right, bottom = player.x, player.y, player.right, player.bottom
+
+        # Everything falls towards a player pinned near the bottom, so anything outside the
+        # player's rows [top, bottom] is skipped before any x or shape test
+
+        # Check coin collisions: circle against the player's box, using the squared
+        # distance from the coin's centre to the nearest point of the box
         for coin in self.coins:
-            if (self.player.x < coin.x + coin.radius and
-                    self.player.x + self.player.width > coin.x - coin.radius and
-                    self.player.y < coin.y + coin.radius and
-                    self.player.y + self.player.height > coin.y - coin.radius and
-                    not coin.collected):
+            if coin.collected or coin.y + coin.radius < top or coin.y - coin.radius > bottom:
+                continue
+            if Circle is not None:
+                if Circle(coin.x, coin.y, coin.radius).colliderect(player_rect):
+                    self.handle_coin_collection(coin)
+                continue
+            dx = coin.x - min(max(coin.x, left), right)
+            dy = coin.y - min(max(coin.y, top), bottom)
+            if dx * dx + dy * dy < coin.radius * coin.radius:
                 self.handle_coin_collection(coin)
 
-        # Check power-up collisions
-        for power_up in self.power_ups[:]:
-            if (self.player.x < power_up.x + power_up.width and
-                    self.player.x + self.player.width > power_up.x and
-                    self.player.y < power_up.y + power_up.height and
-                    self.player.y + self.player.height > power_up.y and
-                    not power_up.collected):
-                self.handle_powerup_collection(power_up)
+        # Check power-up collisions; hits index the in-band list, which collection doesn't touch
+        near = [power_up for power_up in self.power_ups
+                if power_up.bottom >= top and power_up.y <= bottom]
+        if near:
+            for i in player_rect.collidelistall([power_up.rect for power_up in near]):
+                if not near[i].collected:
+                    self.handle_powerup_collection(near[i])
 
         # Check obstacle collisions
-        for obstacle in self.obstacles:
-            if (self.player.x < obstacle.x + obstacle.width and
-                    self.player.x + self.player.width > obstacle.x and
-                    self.player.y < obstacle.y + obstacle.height and
-                    self.player.y + self.player.height > obstacle.y):
-                self.handle_obstacle_collision(obstacle)
+        near = [obstacle for obstacle in self.obstacles
+                if obstacle.bottom >= top and obstacle.y <= bottom]
+        if near:
+            for i in player_rect.collidelistall([obstacle.rect for obstacle in near]):
+                self.handle_obstacle_collision(near[i])
 
     def handle_coin_collection(self, coin: Coin) -> None:
         coin.collected = True
         self.score += coin.value
 
-        for _ in range(20):
-            self.particles.append(Particle(coin.x, coin.y, coin.color))
+        self.particles.spawn(coin.x, coin.y, coin.color, 20)
 
         coin.respawn()
 
@@ -307,28 +591,26 @@ class Game:
     def handle_powerup_collection(self, power_up: PowerUp) -> None:
         power_up.collected = True
 
-        if power_up.type == "shield":
+        if power_up.type == SHIELD:
             self.player.shield = True
-            self.player.shield_time = pygame.time.get_ticks()
-        elif power_up.type == "speed_boost":
+            self.player.shield_time = _ticks()
+        elif power_up.type == SPEED_BOOST:
             self.player.speed_boost = True
-            self.player.speed_boost_time = pygame.time.get_ticks()
-        elif power_up.type == "extra_life":
+            self.player.speed_boost_time = _ticks()
+        elif power_up.type == EXTRA_LIFE:
             self.lives += 1
 
         self.power_ups.remove(power_up)
+        self._power_up_pool.append(power_up)
 
     def handle_obstacle_collision(self, obstacle: Obstacle) -> None:
         if self.player.shield:
             self.player.shield = False
             obstacle.respawn()
 
-            for _ in range(30):
-                self.particles.append(Particle(
-                    self.player.x + self.player.width // 2,
-                    self.player.y + self.player.height // 2,
-                    CYAN
-                ))
+            self.particles.spawn(self.player.x + self.player.width // 2,
+                                 self.player.y + self.player.height // 2,
+                                 CYAN, 30)
         else:
             self.lives -= 1
             obstacle.respawn()
@@ -336,12 +618,9 @@ class Game:
             if self.lives <= 0:
                 self.game_over()
             else:
-                for _ in range(30):
-                    self.particles.append(Particle(
-                        self.player.x + self.player.width // 2,
-                        self.player.y + self.player.height // 2,
-                        RED
-                    ))
+                self.particles.spawn(self.player.x + self.player.width // 2,
+                                     self.player.y + self.player.height // 2,
+                                     RED, 30)
 
     def level_up(self) -> None:
         self.level += 1
@@ -362,7 +641,7 @@ class Game:
 
     def update(self) -> None:
         if self.state == PLAYING:
-            keys = pygame.key.get_pressed()
+            keys = _get_pressed()
             self.player.update(keys)
 
             for obstacle in self.obstacles:
@@ -375,108 +654,134 @@ class Game:
                 if coin.is_off_screen():
                     coin.respawn()
 
-            for power_up in self.power_ups[:]:
+            # Swap the last power-up into a removed slot instead of copying the list and remove()-ing
+            power_ups = self.power_ups
+            i = 0
+            while i < len(power_ups):
+                power_up = power_ups[i]
                 power_up.update()
                 if power_up.is_off_screen():
-                    self.power_ups.remove(power_up)
+                    power_ups[i] = power_ups[-1]
+                    power_ups.pop()
+                    self._power_up_pool.append(power_up)
+                else:
+                    i += 1
 
             self.spawn_power_up()
 
-            for particle in self.particles[:]:
-                particle.update()
-                if particle.is_dead():
-                    self.particles.remove(particle)
+            self.particles.update()
 
             self.check_collisions()
 
-    def draw(self) -> None:
-        if self.dark_mode:
-            main_screen.fill(BLACK)
+    def _text(self, text: str, color: Tuple[int, int, int],
+              font: pygame.font.Font = NORMAL_FONT) -> pygame.Surface:
+        """Renders text through a small LRU cache so unchanged labels aren't rasterized every frame"""
+        key = (font, text, color)
+        cache = self._text_cache
+        surface = cache.get(key)
+        if surface is None:
+            surface = cache[key] = font.render(text, True, color)
+            if len(cache) > TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
         else:
-            main_screen.fill(WHITE)
+            cache.move_to_end(key)
+        return surface
+
+    def draw(self) -> None:
+        background = BLACK if self.dark_mode else WHITE
+        screen = (self.state, self.dark_mode)
+
+        if self.state == PLAYING and self._drawn_screen == screen:
+            # Mid-game only the moving parts change: erase last frame's areas,
+            # draw, and push just the old and new areas to the display
+            for rect in self._dirty_rects:
+                main_screen.fill(background, rect)
+            drawn = self.draw_game()
+            pygame.display.update(self._dirty_rects + drawn)
+            self._dirty_rects = drawn
+            return
+
+        main_screen.fill(background)
 
         if self.state == MENU:
             self.draw_menu()
         elif self.state == PLAYING:
-            self.draw_game()
+            self._dirty_rects = self.draw_game()
         elif self.state == GAME_OVER:
             self.draw_game_over()
         elif self.state == SETTINGS:
             self.draw_settings()
 
         pygame.display.update()
+        self._drawn_screen = screen
 
     def draw_menu(self) -> None:
-        title_text = TITLE_FONT.render("COIN COLLECTOR", True, GOLD)
+        title_text = self._menu_title
         main_screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 150))
 
-        play_text = NORMAL_FONT.render("1. Play Game", True, WHITE if self.dark_mode else BLACK)
-        settings_text = NORMAL_FONT.render("2. Settings", True, WHITE if self.dark_mode else BLACK)
-        quit_text = NORMAL_FONT.render("3. Quit", True, WHITE if self.dark_mode else BLACK)
+        play_text = self._text("1. Play Game", WHITE if self.dark_mode else BLACK)
+        settings_text = self._text("2. Settings", WHITE if self.dark_mode else BLACK)
+        quit_text = self._text("3. Quit", WHITE if self.dark_mode else BLACK)
 
         main_screen.blit(play_text, (SCREEN_WIDTH // 2 - play_text.get_width() // 2, 350))
         main_screen.blit(settings_text, (SCREEN_WIDTH // 2 - settings_text.get_width() // 2, 400))
         main_screen.blit(quit_text, (SCREEN_WIDTH // 2 - quit_text.get_width() // 2, 450))
 
-        hs_text = NORMAL_FONT.render(f"High Score: {self.high_score}", True, GREEN)
+        hs_text = self._text(f"High Score: {self.high_score}", GREEN)
         main_screen.blit(hs_text, (SCREEN_WIDTH // 2 - hs_text.get_width() // 2, 500))
 
-    def draw_game(self) -> None:
-        self.player.draw(main_screen)
-
-        for obstacle in self.obstacles:
-            obstacle.draw(main_screen)
+    def draw_game(self) -> List[pygame.Rect]:
+        """Draws the playfield and returns the screen areas it touched"""
+        # Every entity goes to SDL in one Surface.blits call rather than one call each
+        sprites = [self.player.sprite()]
+        sprites += [obstacle.sprite() for obstacle in self.obstacles]
+        sprites += [coin.sprite() for coin in self.coins if not coin.collected]
+        sprites += [power_up.sprite() for power_up in self.power_ups]
+        sprites += self.particles.sprites()
+        drawn = main_screen.blits(sprites)
 
-        for coin in self.coins:
-            if not coin.collected:
-                coin.draw(main_screen)
-
-        for power_up in self.power_ups:
-            power_up.draw(main_screen)
-
-        for particle in self.particles:
-            particle.draw(main_screen)
-
-        score_text = NORMAL_FONT.render(f"Score: {self.score}", True, WHITE if self.dark_mode else BLACK)
-        level_text = NORMAL_FONT.render(f"Level: {self.level}", True, WHITE if self.dark_mode else BLACK)
-        lives_text = NORMAL_FONT.render(f"Lives: {self.lives}", True, WHITE if self.dark_mode else BLACK)
+        score_text = self._text(f"Score: {self.score}", WHITE if self.dark_mode else BLACK)
+        level_text = self._text(f"Level: {self.level}", WHITE if self.dark_mode else BLACK)
+        lives_text = self._text(f"Lives: {self.lives}", WHITE if self.dark_mode else BLACK)
 
-        main_screen.blit(score_text, (10, 10))
-        main_screen.blit(level_text, (10, 50))
-        main_screen.blit(lives_text, (10, 90))
+        drawn.append(main_screen.blit(score_text, (10, 10)))
+        drawn.append(main_screen.blit(level_text, (10, 50)))
+        drawn.append(main_screen.blit(lives_text, (10, 90)))
 
         if self.player.shield:
-            shield_text = NORMAL_FONT.render("SHIELD", True, CYAN)
-            main_screen.blit(shield_text, (SCREEN_WIDTH - shield_text.get_width() - 10, 10))
+            shield_text = self._shield_label
+            drawn.append(main_screen.blit(shield_text, (SCREEN_WIDTH - shield_text.get_width() - 10, 10)))
 
         if self.player.speed_boost:
-            speed_text = NORMAL_FONT.render("SPEED BOOST", True, ORANGE)
-            main_screen.blit(speed_text, (SCREEN_WIDTH - speed_text.get_width() - 10, 50))
+            speed_text = self._speed_label
+            drawn.append(main_screen.blit(speed_text, (SCREEN_WIDTH - speed_text.get_width() - 10, 50)))
+
+        return drawn
 
     def draw_game_over(self) -> None:
-        game_over_text = GAME_OVER_FONT.render("GAME OVER", True, RED)
+        game_over_text = self._game_over_title
         main_screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, 200))
 
-        score_text = NORMAL_FONT.render(f"Score: {self.score}", True, WHITE if self.dark_mode else BLACK)
+        score_text = self._text(f"Score: {self.score}", WHITE if self.dark_mode else BLACK)
         main_screen.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 300))
 
-        hs_text = NORMAL_FONT.render(f"High Score: {self.high_score}", True, GREEN)
+        hs_text = self._text(f"High Score: {self.high_score}", GREEN)
         main_screen.blit(hs_text, (SCREEN_WIDTH // 2 - hs_text.get_width() // 2, 350))
 
-        restart_text = NORMAL_FONT.render("Press ENTER to return to menu", True, WHITE if self.dark_mode else BLACK)
+        restart_text = self._text("Press ENTER to return to menu", WHITE if self.dark_mode else BLACK)
         main_screen.blit(restart_text, (SCREEN_WIDTH // 2 - restart_text.get_width() // 2, 450))
 
     def draw_settings(self) -> None:
-        title_text = TITLE_FONT.render("SETTINGS", True, GOLD)
+        title_text = self._settings_title
         main_screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 150))
 
-        theme_text = NORMAL_FONT.render("1. Theme: Dark/Light", True, WHITE if self.dark_mode else BLACK)
-        theme_status = NORMAL_FONT.render(f"(Currently: {'Dark' if self.dark_mode else 'Light'})",
-                                          True, GREEN if self.dark_mode else BLUE)
+        theme_text = self._text("1. Theme: Dark/Light", WHITE if self.dark_mode else BLACK)
+        theme_status = self._text(f"(Currently: {'Dark' if self.dark_mode else 'Light'})",
+                                  GREEN if self.dark_mode else BLUE)
         main_screen.blit(theme_text, (SCREEN_WIDTH // 2 - theme_text.get_width() // 2, 300))
         main_screen.blit(theme_status, (SCREEN_WIDTH // 2 - theme_status.get_width() // 2, 340))
 
-        back_text = NORMAL_FONT.render("Press ESC to return to menu", True, WHITE if self.dark_mode else BLACK)
+        back_text = self._text("Press ESC to return to menu", WHITE if self.dark_mode else BLACK)
         main_screen.blit(back_text, (SCREEN_WIDTH // 2 - back_text.get_width() // 2, 650))
 
     def handle_events(self) -> bool:
@@ -508,12 +813,26 @@ class Game:
 
     def run(self) -> None:
         running = True
+        accumulator = 0.0
         while running:
             running = self.handle_events()
-            self.update()
+
+            # Step the logic once per FRAME_MS of real time that has passed, independent of
+            # how long drawing took, then draw once
+            accumulator += self.clock.tick(FPS)
+            steps = 0
+            while accumulator >= FRAME_MS and steps < MAX_CATCH_UP_STEPS:
+                self.update()
+                accumulator -= FRAME_MS
+                steps += 1
+            if steps == MAX_CATCH_UP_STEPS:
+                accumulator = 0.0
+
             self.draw()
-            self.clock.tick(60)
 
+        # Let a pending high-score write finish before the process exits
+        if self._save_thread is not None:
+            self._save_thread.join()
         pygame.quit()
         sys.exit()
 
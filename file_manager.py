@@ -1,14 +1,249 @@
+import errno
 import os
 import shutil
 import hashlib
+import mmap
 import time
 import stat
 import subprocess
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
 from datetime import datetime
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext, simpledialog
 
+# Read size for hashing when hashlib.file_digest isn't available (Python < 3.11)
+HASH_BUFFER_SIZE = 1 << 20
+# Files at least this big are hashed through a memory map, MMAP_HASH_CHUNK bytes per update
+MMAP_HASH_THRESHOLD = 16 << 20
+MMAP_HASH_CHUNK = 4 << 20
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+# Modified column as (year, month, day, hour, minute, second)
+MODIFIED_FORMAT = "%04d-%02d-%02d %02d:%02d:%02d"
+# The file tree is filled a page of rows at a time, the next page once the view
+# has been scrolled past TREE_LOAD_MORE_AT of what's loaded
+TREE_PAGE_SIZE = 500
+TREE_LOAD_MORE_AT = 0.9
+# Folders with at least this many entries have their size and time columns formatted with NumPy
+VECTORIZE_MIN_ROWS = 2000
+
+# Most bytes asked of one os.copy_file_range call; it's repeated until the source is exhausted
+COPY_CHUNK = 1 << 30
+# copy_file_range errors that mean "not between these files", so the copy goes through shutil
+_COPY_FALLBACK_ERRNOS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+
+# Leaf size of the SHA256-TREE digest; leaves are hashed in parallel
+TREE_HASH_LEAF = 64 << 20
+# Refresh requests this close together (in milliseconds) are merged into one listing
+REFRESH_DEBOUNCE_MS = 100
+# An unchanged folder listed less than this many seconds ago is shown from the last listing
+LISTING_CACHE_TTL = 2.0
+# How many removed entries between progress reports when deleting a folder
+REMOVE_PROGRESS_EVERY = 1000
+# Permission bits in the order of the permission window's checkboxes: owner, group, others
+PERM_BITS = (stat.S_IRUSR, stat.S_IWUSR, stat.S_IXUSR,
+             stat.S_IRGRP, stat.S_IWGRP, stat.S_IXGRP,
+             stat.S_IROTH, stat.S_IWOTH, stat.S_IXOTH)
+# How often the Tk thread checks on background work, in milliseconds
+WORKER_POLL_MS = 50
+
+# Hashing and copy/move/delete run here so the Tk event loop keeps running
+_WORKER_POOL = ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 2) // 2))
+
+
+def hash_file(file_path, hash_name, progress=None):
+    """
+    Returns the hex digest of a file's contents with the named hashlib algorithm.
+    If given, progress is called with the number of bytes hashed so far as it goes.
+    """
+    # hashlib.new goes to the OpenSSL implementation when there is one; these digests
+    # are checksums, not security, so FIPS builds may still hand out MD5/SHA1
+    hasher = hashlib.new(hash_name, usedforsecurity=False)
+
+    with open(file_path, 'rb', buffering=0) as f:
+        mapped = None
+        if os.fstat(f.fileno()).st_size >= MMAP_HASH_THRESHOLD:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass  # Not mappable (some network and special files); read it instead
+
+        if mapped is not None:
+            # Feed the hasher straight from the page cache, without copying into Python buffers
+            with mapped, memoryview(mapped) as view:
+                for offset in range(0, len(view), MMAP_HASH_CHUNK):
+                    hasher.update(view[offset:offset + MMAP_HASH_CHUNK])
+                    if progress is not None:
+                        progress(min(offset + MMAP_HASH_CHUNK, len(view)))
+        elif hasattr(hashlib, 'file_digest'):
+            # The whole read/update loop runs in C on a reused buffer
+            hashlib.file_digest(f, lambda: hasher)
+        else:
+            buffer = bytearray(HASH_BUFFER_SIZE)
+            view = memoryview(buffer)
+            hashed = 0
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                hasher.update(view[:size])
+                hashed += size
+                if progress is not None:
+                    progress(hashed)
+
+    return hasher.hexdigest()
+
+
+def tree_hash_file(file_path, progress=None):
+    """
+    Returns the SHA256-TREE digest of a file: the SHA-256 of the concatenated SHA-256 digests
+    of its consecutive TREE_HASH_LEAF-sized pieces. The pieces are hashed in parallel, one
+    thread per CPU. This is its own digest and doesn't match a plain SHA-256 of the file.
+    """
+    size = os.path.getsize(file_path)
+    starts = range(0, size, TREE_HASH_LEAF) or [0]
+    hashed = [0] * len(starts)
+
+    def hash_leaf(index):
+        hasher = hashlib.sha256()
+        buffer = bytearray(HASH_BUFFER_SIZE)
+        view = memoryview(buffer)
+        # Each worker reads its piece through its own file handle
+        with open(file_path, 'rb', buffering=0) as f:
+            f.seek(starts[index])
+            remaining = min(TREE_HASH_LEAF, size - starts[index])
+            while remaining:
+                count = f.readinto(view[:min(remaining, HASH_BUFFER_SIZE)])
+                if not count:
+                    break
+                hasher.update(view[:count])
+                remaining -= count
+                if progress is not None:
+                    hashed[index] += count
+                    progress(sum(hashed))
+        return hasher.digest()
+
+    with ThreadPoolExecutor(max_workers=min(len(starts), os.cpu_count() or 1)) as pool:
+        digests = list(pool.map(hash_leaf, range(len(starts))))
+    return hashlib.sha256(b''.join(digests)).hexdigest()
+
+
+def _raise(error):
+    raise error
+
+
+def remove_tree(path, progress=None):
+    """
+    Deletes a folder and everything in it, like shutil.rmtree. If given, progress is called with
+    the number of entries removed so far every REMOVE_PROGRESS_EVERY entries.
+    """
+    if os.path.islink(path):
+        os.unlink(path)  # Same as rmtree: never follow a link into its target
+        return
+
+    removed = 0
+    # Bottom-up, so each folder is already empty by the time it's reached
+    for dirpath, dirnames, filenames in os.walk(path, topdown=False, onerror=_raise):
+        for name in filenames:
+            os.unlink(os.path.join(dirpath, name))
+        for name in dirnames:
+            # Links to folders are listed as folders but aren't walked into; unlink those
+            dir_path = os.path.join(dirpath, name)
+            if os.path.islink(dir_path):
+                os.unlink(dir_path)
+            else:
+                os.rmdir(dir_path)
+        if progress is not None:
+            count = removed + len(filenames) + len(dirnames)
+            if count // REMOVE_PROGRESS_EVERY != removed // REMOVE_PROGRESS_EVERY:
+                progress(count)
+            removed = count
+    os.rmdir(path)
+
+
+def fast_copy(src, dst):
+    """
+    Same as shutil.copy2, but on Linux the bytes are copied with os.copy_file_range, which
+    stays in the kernel and can clone the data outright on filesystems like btrfs and XFS.
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+    copied = False
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                total = 0
+                while True:
+                    count = os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_CHUNK)
+                    if not count:
+                        break
+                    total += count
+            # Some filesystems (FUSE, overlay, procfs-like ones) return 0 before the end, or report
+            # no size at all; anything short or empty is copied again the ordinary way
+            copied = total == size and total > 0
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+    if not copied:
+        shutil.copyfile(src, dst)
+
+    shutil.copystat(src, dst)
+    return dst
+
+
+def format_columns_vectorized(stats):
+    """
+    Same strings as format_size and the '%Y-%m-%d %H:%M:%S' local modified time, built for
+    every stat result at once with array operations. Returns (sizes, modified_times) lists.
+    """
+    import numpy as np
+    count = len(stats)
+    sizes = np.fromiter((st.st_size for st in stats), dtype=np.int64, count=count)
+    mtimes = np.floor(np.fromiter((st.st_mtime for st in stats), dtype=np.float64, count=count)).astype(np.int64)
+
+    # Unit index is how many powers of 1024 the size reaches, capped at PB
+    unit = np.zeros(count, dtype=np.int32)
+    for power in range(1, len(SIZE_UNITS)):
+        unit += sizes >= (1 << (10 * power))
+    scaled = np.ldexp(sizes.astype(np.float64), -10 * unit)
+    size_text = [f"{value:.1f} {name}"
+                 for value, name in zip(scaled.tolist(), np.array(SIZE_UNITS)[unit].tolist())]
+
+    # Shift to local time; the UTC offset is looked up once per distinct day, not per file,
+    # except on days where it changes (DST switches), whose files are looked up one by one
+    days, inverse = np.unique(mtimes // 86400, return_inverse=True)
+    day_offsets = np.array([(time.localtime(int(day) * 86400).tm_gmtoff,
+                             time.localtime(int(day) * 86400 + 86399).tm_gmtoff) for day in days],
+                           dtype=np.int64).reshape(-1, 2)[inverse]
+    offsets = day_offsets[:, 0]
+    for i in np.flatnonzero(day_offsets[:, 0] != day_offsets[:, 1]).tolist():
+        offsets[i] = time.localtime(int(mtimes[i])).tm_gmtoff
+    local = (mtimes + offsets).astype('datetime64[s]')
+
+    # ISO strings have a 'T' at index 10 where the column shows a space
+    chars = np.datetime_as_string(local, unit='s').astype('U19').view('U1').reshape(count, 19)
+    chars[:, 10] = ' '
+    time_text = chars.view('U19').ravel().tolist()
+
+    return size_text, time_text
+
+
+@dataclass(slots=True)
+class Entry:
+    """What the listing learned about one row. st and is_dir are None for symlinks, whose
+    own metadata isn't what the handlers (which follow links) want."""
+    st: Optional[os.stat_result]
+    name: str
+    is_dir: Optional[bool]
+    path: str
+
 
 class AdvancedFileManager:
     def __init__(self, root):
@@ -26,6 +261,20 @@ class AdvancedFileManager:
         self.style.map('Treeview', background=[('selected', '#0066cc')])
 
         self.current_path = os.path.expanduser("~")
+        # Entries captured while listing, keyed by path, so the handlers for a selected
+        # row don't stat it or split its path again
+        self.entry_cache = {}
+        # Recent listings by folder path: (folder mtime_ns, time listed, rows, entry cache)
+        self.listing_cache = {}
+        # Pending after() id of a debounced refresh
+        self.refresh_id = None
+        # Listed rows not yet inserted into the tree
+        self.pending_rows = deque()
+        # The hash and permission windows are built on first use, then hidden and reused
+        self.hash_window = None
+        self.perm_window = None
+        # Bumped whenever the hash window is pointed at new work; older results are dropped
+        self.hash_job = 0
         self.create_widgets()
         self.update_file_list()
 
@@ -50,7 +299,7 @@ class AdvancedFileManager:
 
         ttk.Button(nav_frame, text="Back", command=self.go_back).pack(side=tk.LEFT, padx=2)
         ttk.Button(nav_frame, text="Up", command=self.go_up).pack(side=tk.LEFT, padx=2)
-        ttk.Button(nav_frame, text="Refresh", command=self.update_file_list).pack(side=tk.LEFT, padx=2)
+        ttk.Button(nav_frame, text="Refresh", command=self.schedule_refresh).pack(side=tk.LEFT, padx=2)
         ttk.Button(nav_frame, text="New Folder", command=self.create_folder).pack(side=tk.LEFT, padx=2)
 
         # File tree
@@ -69,6 +318,9 @@ class AdvancedFileManager:
         self.tree.column('type', width=100)
         self.tree.column('modified', width=150)
 
+        # The tree reports the visible fraction here whenever it scrolls or its contents change
+        self.tree.configure(yscrollcommand=self.on_tree_scroll)
+
         self.tree.bind("<Double-1>", self.on_double_click)
         self.tree.bind("<Button-3>", self.show_context_menu)
 
@@ -89,47 +341,169 @@ class AdvancedFileManager:
         self.context_menu.add_command(label="Calculate Hash", command=self.calculate_hash)
         self.context_menu.add_command(label="Change Permissions", command=self.change_permissions)
 
-    def update_file_list(self):
+    def schedule_refresh(self):
+        # Repeated clicks and Return presses within REFRESH_DEBOUNCE_MS list the folder once
+        if self.refresh_id is not None:
+            self.root.after_cancel(self.refresh_id)
+        self.refresh_id = self.root.after(REFRESH_DEBOUNCE_MS, self.run_scheduled_refresh)
+
+    def run_scheduled_refresh(self):
+        self.refresh_id = None
+        self.update_file_list(use_cache=True)
+
+    def update_file_list(self, use_cache=False):
+        """
+        Lists the current folder into the tree. With use_cache, a listing of the same folder
+        taken less than LISTING_CACHE_TTL seconds ago is reused if the folder hasn't changed
+        since; the file operations here don't pass it, so they always see their own changes.
+        """
         self.tree.delete(*self.tree.get_children())
+        # A new dict rather than clear(), since the old one may be kept in listing_cache
+        self.entry_cache = {}
 
+        # Rows are prepared as (text, values, iid) first and inserted together at the end
+        rows = []
         try:
             # Add parent folder (if not root)
             if self.current_path != os.path.sep:
                 parent_path = os.path.dirname(self.current_path)
-                self.tree.insert('', 'end', text="..", values=("..", "", "Folder", ""), iid="..")
+                rows.append(("..", ("..", "", "Folder", ""), ".."))
+
+            path = self.current_path
+            folder_mtime = os.stat(path).st_mtime_ns
+            now = time.monotonic()
+            cached = self.listing_cache.get(path) if use_cache else None
+            if cached is not None and cached[0] == folder_mtime and now - cached[1] < LISTING_CACHE_TTL:
+                listed_rows, self.entry_cache = cached[2], cached[3]
+            else:
+                listed_rows = self.list_folder(path)
+                self.listing_cache = {cached_path: listing
+                                      for cached_path, listing in self.listing_cache.items()
+                                      if now - listing[1] < LISTING_CACHE_TTL}
+                self.listing_cache[path] = (folder_mtime, now, listed_rows, self.entry_cache)
+            rows.extend(listed_rows)
+
+            self.status_bar.config(text=f"Items: {len(listed_rows)}")
+        except PermissionError:
+            messagebox.showerror("Error", "Permission denied for this folder")
 
-            # List files and folders
-            for item in os.listdir(self.current_path):
-                full_path = os.path.join(self.current_path, item)
-                item_stat = os.stat(full_path)
+        # Only the first page goes in now; scrolling towards the end brings in the rest.
+        # Take the tree off screen while it's refilled so Tk lays it out once, not after every row
+        self.pending_rows = deque(rows)
+        self.tree.pack_forget()
+        self.insert_next_page()
+        self.tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5, before=self.status_bar)
+
+    def list_folder(self, path):
+        """Tree rows for the contents of a folder; fills self.entry_cache as it goes"""
+        # List files and folders in one scandir pass; DirEntry reuses what the directory
+        # read already returned instead of a fresh stat/isdir per path
+        with os.scandir(path) as it:
+            entries = list(it)
+
+        # The loops below run once per entry, so attributes they use are bound to locals first
+        entry_cache = self.entry_cache
+        stats = []
+        dir_flags = []
+        add_stat = stats.append
+        add_dir_flag = dir_flags.append
+        for entry in entries:
+            item_stat = entry.stat(follow_symlinks=False)
+            is_dir = entry.is_dir(follow_symlinks=False)
+            item_path = entry.path
+            if entry.is_symlink():
+                entry_cache[item_path] = Entry(None, entry.name, None, item_path)
+            else:
+                entry_cache[item_path] = Entry(item_stat, entry.name, is_dir, item_path)
+            add_stat(item_stat)
+            add_dir_flag(is_dir)
+
+        sizes, modified_times = self.format_columns(stats)
+
+        rows = []
+        add_row = rows.append
+        for entry, is_dir, size, modified in zip(entries, dir_flags, sizes, modified_times):
+            name = entry.name
+            if is_dir:
+                add_row((name, (name, "", "Folder", modified), entry.path))
+            else:
+                add_row((name, (name, size, "File", modified), entry.path))
+        return rows
+
+    def insert_next_page(self):
+        pending = self.pending_rows
+        next_row = pending.popleft
+        insert = self.tree.insert
+        for _ in range(min(TREE_PAGE_SIZE, len(pending))):
+            text, values, iid = next_row()
+            insert('', 'end', text=text, values=values, iid=iid)
+
+    def on_tree_scroll(self, first, last):
+        if self.pending_rows and float(last) >= TREE_LOAD_MORE_AT:
+            self.insert_next_page()
+
+    def run_in_background(self, on_done, func, *args, on_poll=None):
+        """
+        Runs func(*args) on the worker pool and calls on_done(future) on the Tk thread once it
+        finishes. on_poll, if given, is called on the Tk thread each time it's checked meanwhile.
+        """
+        future = _WORKER_POOL.submit(func, *args)
+        self.root.after(WORKER_POLL_MS, self.poll_background, future, on_done, on_poll)
+
+    def poll_background(self, future, on_done, on_poll):
+        # Tk widgets may only be touched from this thread, so results are collected by polling
+        if not future.done():
+            if on_poll is not None:
+                on_poll()
+            self.root.after(WORKER_POLL_MS, self.poll_background, future, on_done, on_poll)
+            return
+        on_done(future)
 
-                if os.path.isdir(full_path):
-                    item_type = "Folder"
-                    size = ""
-                else:
-                    item_type = "File"
-                    size = self.format_size(item_stat.st_size)
+    def finish_file_operation(self, future, error_text, done_text=None):
+        try:
+            future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"{error_text}: {e}")
+        self.update_file_list()
+        if done_text is not None and future.exception() is None:
+            self.status_bar.config(text=done_text)
 
-                modified = datetime.fromtimestamp(item_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                self.tree.insert('', 'end', text=item, values=(item, size, item_type, modified), iid=full_path)
+    def get_stat(self, path):
+        entry = self.entry_cache.get(path)
+        return entry.st if entry is not None and entry.st is not None else os.stat(path)
 
-            self.status_bar.config(text=f"Items: {len(os.listdir(self.current_path))}")
-        except PermissionError:
-            messagebox.showerror("Error", "Permission denied for this folder")
+    def is_dir(self, path):
+        entry = self.entry_cache.get(path)
+        return entry.is_dir if entry is not None and entry.is_dir is not None else os.path.isdir(path)
+
+    def get_name(self, path):
+        entry = self.entry_cache.get(path)
+        return entry.name if entry is not None else os.path.basename(path)
+
+    def format_columns(self, stats):
+        """Size and modified-time column strings for a list of stat results"""
+        if len(stats) >= VECTORIZE_MIN_ROWS:
+            try:
+                return format_columns_vectorized(stats)
+            except ImportError:
+                pass  # No NumPy; format them one by one
+        # localtime's first six fields go straight into one %-format; no datetime per row
+        localtime = time.localtime
+        format_size = self.format_size
+        return ([format_size(st.st_size) for st in stats],
+                [MODIFIED_FORMAT % localtime(st.st_mtime)[:6] for st in stats])
 
     def format_size(self, size):
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} PB"
+        # Each unit is 2**10 of the last, so the bit length picks the unit without a loop
+        unit = min((size.bit_length() - 1) // 10, 5) if size > 0 else 0
+        return f"{size / (1 << (unit * 10)):.1f} {SIZE_UNITS[unit]}"
 
     def on_double_click(self, event):
         item = self.tree.selection()[0]
         if item == "..":
             self.go_up()
         else:
-            if os.path.isdir(item):
+            if self.is_dir(item):
                 self.current_path = item
                 self.path_entry.delete(0, tk.END)
                 self.path_entry.insert(0, self.current_path)
@@ -141,7 +515,7 @@ class AdvancedFileManager:
         new_path = self.path_entry.get()
         if os.path.exists(new_path):
             self.current_path = new_path
-            self.update_file_list()
+            self.schedule_refresh()
         else:
             messagebox.showerror("Error", "The specified path does not exist")
             self.path_entry.delete(0, tk.END)
@@ -179,7 +553,7 @@ class AdvancedFileManager:
         if item == "..":
             self.go_up()
         else:
-            if os.path.isdir(item):
+            if self.is_dir(item):
                 self.current_path = item
                 self.path_entry.delete(0, tk.END)
                 self.path_entry.insert(0, self.current_path)
@@ -203,11 +577,11 @@ class AdvancedFileManager:
             return
 
         full_path = item
-        stat_info = os.stat(full_path)
+        stat_info = self.get_stat(full_path)
 
-        properties = f"Name: {os.path.basename(full_path)}\n"
+        properties = f"Name: {self.get_name(full_path)}\n"
         properties += f"Path: {full_path}\n"
-        properties += f"Type: {'Folder' if os.path.isdir(full_path) else 'File'}\n"
+        properties += f"Type: {'Folder' if self.is_dir(full_path) else 'File'}\n"
         properties += f"Size: {self.format_size(stat_info.st_size)}\n"
         properties += f"Created: {datetime.fromtimestamp(stat_info.st_ctime)}\n"
         properties += f"Modified: {datetime.fromtimestamp(stat_info.st_mtime)}\n"
@@ -215,7 +589,7 @@ class AdvancedFileManager:
         properties += f"Owner: {stat_info.st_uid}\n"
         properties += f"Group: {stat_info.st_gid}\n"
 
-        if not os.path.isdir(full_path):
+        if not self.is_dir(full_path):
             properties += f"Extension: {os.path.splitext(full_path)[1]}\n"
 
         messagebox.showinfo("Properties", properties)
@@ -226,15 +600,25 @@ class AdvancedFileManager:
             return
 
         full_path = item
-        if messagebox.askyesno("Delete", f"Are you sure you want to delete '{os.path.basename(full_path)}'?"):
-            try:
-                if os.path.isdir(full_path):
-                    shutil.rmtree(full_path)
-                else:
-                    os.remove(full_path)
-                self.update_file_list()
-            except Exception as e:
-                messagebox.showerror("Error", f"Error deleting: {e}")
+        name = self.get_name(full_path)
+        if messagebox.askyesno("Delete", f"Are you sure you want to delete '{name}'?"):
+            self.status_bar.config(text=f"Deleting: {name}")
+            on_done = lambda future: self.finish_file_operation(future, "Error deleting")
+            if not self.is_dir(full_path):
+                self.run_in_background(on_done, os.remove, full_path)
+                return
+
+            # Entries removed so far; the worker writes it, the Tk-side poll reads it
+            removed = [0]
+
+            def progress(count):
+                removed[0] = count
+
+            def show_progress():
+                if removed[0]:
+                    self.status_bar.config(text=f"Deleting: {name} ({removed[0]} items removed)")
+
+            self.run_in_background(on_done, remove_tree, full_path, progress, on_poll=show_progress)
 
     def rename_selected(self):
         item = self.tree.selection()[0]
@@ -242,8 +626,9 @@ class AdvancedFileManager:
             return
 
         full_path = item
-        new_name = simpledialog.askstring("Rename", "Enter new name:", initialvalue=os.path.basename(full_path))
-        if new_name and new_name != os.path.basename(full_path):
+        name = self.get_name(full_path)
+        new_name = simpledialog.askstring("Rename", "Enter new name:", initialvalue=name)
+        if new_name and new_name != name:
             try:
                 new_path = os.path.join(os.path.dirname(full_path), new_name)
                 os.rename(full_path, new_path)
@@ -257,7 +642,7 @@ class AdvancedFileManager:
             return
 
         self.clipboard = {'operation': 'copy', 'path': item}
-        self.status_bar.config(text=f"Ready to copy: {os.path.basename(item)}")
+        self.status_bar.config(text=f"Ready to copy: {self.get_name(item)}")
 
     def move_selected(self):
         item = self.tree.selection()[0]
@@ -265,148 +650,179 @@ class AdvancedFileManager:
             return
 
         self.clipboard = {'operation': 'move', 'path': item}
-        self.status_bar.config(text=f"Ready to move: {os.path.basename(item)}")
+        self.status_bar.config(text=f"Ready to move: {self.get_name(item)}")
 
     def paste(self):
         if hasattr(self, 'clipboard'):
             dest = self.current_path
             src = self.clipboard['path']
 
-            try:
-                if self.clipboard['operation'] == 'copy':
-                    if os.path.isdir(src):
-                        shutil.copytree(src, os.path.join(dest, os.path.basename(src)))
-                    else:
-                        shutil.copy2(src, dest)
-                elif self.clipboard['operation'] == 'move':
-                    shutil.move(src, dest)
+            if self.clipboard['operation'] == 'copy':
+                if os.path.isdir(src):
+                    target = os.path.join(dest, os.path.basename(src))
+                    operation = lambda: shutil.copytree(src, target, copy_function=fast_copy)
+                else:
+                    operation = lambda: fast_copy(src, dest)
+                self.status_bar.config(text=f"Copying: {os.path.basename(src)}")
+            elif self.clipboard['operation'] == 'move':
+                operation = lambda: shutil.move(src, dest)
+                self.status_bar.config(text=f"Moving: {os.path.basename(src)}")
+            else:
+                return
 
-                self.update_file_list()
-                self.status_bar.config(text="Operation completed successfully")
-            except Exception as e:
-                messagebox.showerror("Error", f"Operation error: {e}")
+            self.run_in_background(
+                lambda future: self.finish_file_operation(future, "Operation error",
+                                                          "Operation completed successfully"),
+                operation)
 
     def calculate_hash(self):
         item = self.tree.selection()[0]
-        if item == ".." or os.path.isdir(item):
+        if item == ".." or self.is_dir(item):
             messagebox.showerror("Error", "This operation is only available for files")
             return
 
-        hash_window = tk.Toplevel(self.root)
-        hash_window.title("Calculate File Hash")
-        hash_window.geometry("400x300")
+        if self.hash_window is None:
+            self.create_hash_window()
+
+        self.hash_path = item
+        self.hash_job += 1
+        self.hash_label.config(text=f"Calculating hash for: {self.get_name(item)}")
+        self.hash_progress['value'] = 0
+        self.hash_result.delete(1.0, tk.END)
+        self.hash_window.deiconify()
+        self.hash_window.lift()
+
+    def create_hash_window(self):
+        self.hash_window = tk.Toplevel(self.root)
+        self.hash_window.title("Calculate File Hash")
+        self.hash_window.geometry("500x300")
+        # Closing only hides it, so the next hash doesn't build it all again
+        self.hash_window.protocol("WM_DELETE_WINDOW", self.hide_hash_window)
 
-        ttk.Label(hash_window, text=f"Calculating hash for: {os.path.basename(item)}").pack(pady=5)
+        self.hash_label = ttk.Label(self.hash_window)
+        self.hash_label.pack(pady=5)
 
-        hash_types = ['MD5', 'SHA1', 'SHA256', 'SHA512']
+        hash_types = ['MD5', 'SHA1', 'SHA256', 'SHA512', 'SHA256-TREE']
         self.hash_var = tk.StringVar(value=hash_types[0])
 
-        hash_frame = ttk.Frame(hash_window)
+        hash_frame = ttk.Frame(self.hash_window)
         hash_frame.pack(pady=5)
 
         for htype in hash_types:
             ttk.Radiobutton(hash_frame, text=htype, variable=self.hash_var, value=htype).pack(side=tk.LEFT, padx=5)
 
-        self.hash_result = scrolledtext.ScrolledText(hash_window, height=8, width=50)
+        self.hash_progress = ttk.Progressbar(self.hash_window, mode='determinate', maximum=100)
+        self.hash_progress.pack(pady=5, padx=5, fill=tk.X)
+
+        self.hash_result = scrolledtext.ScrolledText(self.hash_window, height=8, width=50)
         self.hash_result.pack(pady=5, padx=5, fill=tk.BOTH, expand=True)
 
-        ttk.Button(hash_window, text="Calculate", command=lambda: self.do_calculate_hash(item)).pack(pady=5)
+        ttk.Button(self.hash_window, text="Calculate",
+                   command=lambda: self.do_calculate_hash(self.hash_path)).pack(pady=5)
+
+    def hide_hash_window(self):
+        self.hash_job += 1  # Drop the result of a hash still running
+        self.hash_window.withdraw()
 
     def do_calculate_hash(self, file_path):
         hash_type = self.hash_var.get()
-        buffer_size = 65536
+        self.hash_job += 1
+        job = self.hash_job
 
         try:
-            if hash_type == 'MD5':
-                hasher = hashlib.md5()
-            elif hash_type == 'SHA1':
-                hasher = hashlib.sha1()
-            elif hash_type == 'SHA256':
-                hasher = hashlib.sha256()
-            elif hash_type == 'SHA512':
-                hasher = hashlib.sha512()
-
-            with open(file_path, 'rb') as f:
-                while True:
-                    data = f.read(buffer_size)
-                    if not data:
-                        break
-                    hasher.update(data)
+            total = os.path.getsize(file_path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Hash calculation error: {e}")
+            return
+
+        # Bytes hashed so far; the worker writes it, the Tk-side poll reads it
+        hashed = [0]
+
+        def progress(count):
+            hashed[0] = count
 
-            self.hash_result.delete(1.0, tk.END)
-            self.hash_result.insert(tk.END, f"{hash_type} hash:\n{hasher.hexdigest()}")
+        self.hash_progress['value'] = 0
+        self.hash_result.delete(1.0, tk.END)
+        self.hash_result.insert(tk.END, f"Calculating {hash_type} hash...")
+
+        def show_progress():
+            if total and job == self.hash_job:
+                self.hash_progress['value'] = 100 * hashed[0] / total
+
+        if hash_type == 'SHA256-TREE':
+            self.run_in_background(lambda future: self.show_hash(future, hash_type, job),
+                                   tree_hash_file, file_path, progress, on_poll=show_progress)
+        else:
+            self.run_in_background(lambda future: self.show_hash(future, hash_type, job),
+                                   hash_file, file_path, hash_type.lower(), progress, on_poll=show_progress)
+
+    def show_hash(self, future, hash_type, job):
+        if job != self.hash_job:
+            return  # Hash window was closed or moved on to other work; drop the result
+
+        try:
+            digest = future.result()
         except Exception as e:
             messagebox.showerror("Error", f"Hash calculation error: {e}")
+            return
+
+        self.hash_progress['value'] = 100
+        self.hash_result.delete(1.0, tk.END)
+        self.hash_result.insert(tk.END, f"{hash_type} hash:\n{digest}")
 
     def change_permissions(self):
         item = self.tree.selection()[0]
         if item == "..":
             return
 
-        current_permissions = stat.S_IMODE(os.stat(item).st_mode)
+        current_permissions = stat.S_IMODE(self.get_stat(item).st_mode)
 
-        perm_window = tk.Toplevel(self.root)
-        perm_window.title("Change Permissions")
-        perm_window.geometry("300x300")
+        if self.perm_window is None:
+            self.create_perm_window()
 
-        ttk.Label(perm_window, text=f"Current permissions: {oct(current_permissions)}").pack(pady=5)
+        self.perm_path = item
+        self.perm_label.config(text=f"Current permissions: {oct(current_permissions)}")
 
-        # Owner permissions
-        owner_frame = ttk.LabelFrame(perm_window, text="Owner")
-        owner_frame.pack(pady=5, padx=5, fill=tk.X)
+        for bit, var in zip(PERM_BITS, self.perm_vars):
+            var.set(bool(current_permissions & bit))
 
-        self.owner_read = tk.BooleanVar(value=bool(current_permissions & stat.S_IRUSR))
-        self.owner_write = tk.BooleanVar(value=bool(current_permissions & stat.S_IWUSR))
-        self.owner_exec = tk.BooleanVar(value=bool(current_permissions & stat.S_IXUSR))
+        self.perm_window.deiconify()
+        self.perm_window.lift()
 
-        ttk.Checkbutton(owner_frame, text="Read", variable=self.owner_read).pack(anchor=tk.W)
-        ttk.Checkbutton(owner_frame, text="Write", variable=self.owner_write).pack(anchor=tk.W)
-        ttk.Checkbutton(owner_frame, text="Execute", variable=self.owner_exec).pack(anchor=tk.W)
+    def create_perm_window(self):
+        self.perm_window = tk.Toplevel(self.root)
+        self.perm_window.title("Change Permissions")
+        self.perm_window.geometry("300x300")
+        # Closing only hides it, so the next change doesn't build it all again
+        self.perm_window.protocol("WM_DELETE_WINDOW", self.perm_window.withdraw)
 
-        # Group permissions
-        group_frame = ttk.LabelFrame(perm_window, text="Group")
-        group_frame.pack(pady=5, padx=5, fill=tk.X)
+        self.perm_label = ttk.Label(self.perm_window)
+        self.perm_label.pack(pady=5)
 
-        self.group_read = tk.BooleanVar(value=bool(current_permissions & stat.S_IRGRP))
-        self.group_write = tk.BooleanVar(value=bool(current_permissions & stat.S_IWGRP))
-        self.group_exec = tk.BooleanVar(value=bool(current_permissions & stat.S_IXGRP))
+        # One checkbox per PERM_BITS entry, grouped three to a frame
+        self.perm_vars = []
+        for group in ("Owner", "Group", "Others"):
+            group_frame = ttk.LabelFrame(self.perm_window, text=group)
+            group_frame.pack(pady=5, padx=5, fill=tk.X)
+            for label in ("Read", "Write", "Execute"):
+                var = tk.BooleanVar()
+                ttk.Checkbutton(group_frame, text=label, variable=var).pack(anchor=tk.W)
+                self.perm_vars.append(var)
 
-        ttk.Checkbutton(group_frame, text="Read", variable=self.group_read).pack(anchor=tk.W)
-        ttk.Checkbutton(group_frame, text="Write", variable=self.group_write).pack(anchor=tk.W)
-        ttk.Checkbutton(group_frame, text="Execute", variable=self.group_exec).pack(anchor=tk.W)
-
-        # Others permissions
-        other_frame = ttk.LabelFrame(perm_window, text="Others")
-        other_frame.pack(pady=5, padx=5, fill=tk.X)
-
-        self.other_read = tk.BooleanVar(value=bool(current_permissions & stat.S_IROTH))
-        self.other_write = tk.BooleanVar(value=bool(current_permissions & stat.S_IWOTH))
-        self.other_exec = tk.BooleanVar(value=bool(current_permissions & stat.S_IXOTH))
-
-        ttk.Checkbutton(other_frame, text="Read", variable=self.other_read).pack(anchor=tk.W)
-        ttk.Checkbutton(other_frame, text="Write", variable=self.other_write).pack(anchor=tk.W)
-        ttk.Checkbutton(other_frame, text="Execute", variable=self.other_exec).pack(anchor=tk.W)
-
-        ttk.Button(perm_window, text="Apply Changes",
-                   command=lambda: self.do_change_permissions(item)).pack(pady=10)
+        ttk.Button(self.perm_window, text="Apply Changes",
+                   command=lambda: self.do_change_permissions(self.perm_path)).pack(pady=10)
 
     def do_change_permissions(self, path):
         new_permissions = 0
-
-        if self.owner_read.get(): new_permissions |= stat.S_IRUSR
-        if self.owner_write.get(): new_permissions |= stat.S_IWUSR
-        if self.owner_exec.get(): new_permissions |= stat.S_IXUSR
-
-        if self.group_read.get(): new_permissions |= stat.S_IRGRP
-        if self.group_write.get(): new_permissions |= stat.S_IWGRP
-        if self.group_exec.get(): new_permissions |= stat.S_IXGRP
-
-        if self.other_read.get(): new_permissions |= stat.S_IROTH
-        if self.other_write.get(): new_permissions |= stat.S_IWOTH
-        if self.other_exec.get(): new_permissions |= stat.S_IXOTH
+        for bit, var in zip(PERM_BITS, self.perm_vars):
+            # -1 keeps the bit and -0 clears it, so there's no branch per checkbox
+            new_permissions |= bit & -int(var.get())
 
         try:
             os.chmod(path, new_permissions)
+            # The listed mode is stale now, and chmod doesn't change the folder's mtime
+            self.entry_cache.pop(path, None)
+            self.listing_cache.pop(os.path.dirname(path), None)
             messagebox.showinfo("Success", "Permissions changed successfully")
         except Exception as e:
             messagebox.showerror("Error", f"Error changing permissions: {e}")
@@ -0,0 +1,513 @@
+import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
+import lxml.etree
+import lxml.html
+import json
+import orjson
+import time
+from datetime import datetime
+import pytz
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import csv
+from typing import Dict, Optional
+from functools import wraps
+from threading import Lock
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Retry only takes a backoff cap and jitter from urllib3 2.0 on; 1.26 (which requests still
+# allows) keeps its fixed cap and retries without jitter
+_RETRY_BACKOFF_OPTIONS = int(urllib3.__version__.split('.')[0]) >= 2
+
+# Strips thousands separators and stray spaces from prices like "1,234,567"
+_PRICE_TRIM = str.maketrans('', '', ', ')
+
+# Price ("nf") and change cells of every market row on the /currency page, in one pass
+_CURRENCY_CELLS = lxml.etree.XPath(
+    "//tr[@data-market-row]/td[contains(concat(' ', normalize-space(@class), ' '), ' nf ')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' change ')]"
+)
+
+# Price ("value") and change spans on a /profile/<item_id> page; the first of each is the headline figure
+_PROFILE_CELLS = lxml.etree.XPath(
+    "(//span[contains(concat(' ', normalize-space(@class), ' '), ' value ')])[1]"
+    " | (//span[contains(concat(' ', normalize-space(@class), ' '), ' change ')])[1]"
+)
+
+
+def parse_price(value) -> Optional[float]:
+    """Convert a raw TGJU price (number or string like "1,234,567") to a number"""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    try:
+        number = float(str(value).translate(_PRICE_TRIM))
+    except ValueError:
+        return None
+    return int(number) if number.is_integer() else number
+
+
+def format_price(price_irr: Optional[float]) -> str:
+    """Format a numeric IRR price for display"""
+    return 'N/A' if price_irr is None else f"{price_irr:,} IRR"
+
+# Application settings
+CONFIG = {
+    'base_url': 'https://www.tgju.org',
+    'timeout': 15,
+    'max_retries': 3,
+    'retry_delay': 1,
+    'retry_delay_max': 10,
+    'retry_jitter': 1,
+    'pool_connections': 4,
+    'pool_maxsize': 32,
+    'max_workers': 8,
+    'cache_ttl': 60,
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'currency_ids': {
+        'price_dollar_rl': 'US Dollar',
+    'price_eur': 'Euro',
+    'price_gbp': 'British Pound',
+    'price_try': 'Turkish Lira',
+    'price_aed': 'UAE Dirham',
+    'price_cny': 'Chinese Yuan',
+    'price_rub': 'Russian Ruble',
+    'price_jpy': 'Japanese Yen',
+    'price_inr': 'Indian Rupee',
+    'price_sar': 'Saudi Riyal',
+    'price_cad': 'Canadian Dollar',
+    'price_aud': 'Australian Dollar',
+    'price_chf': 'Swiss Franc',
+    'price_sek': 'Swedish Krona',
+    'price_nok': 'Norwegian Krone',
+    'price_dkk': 'Danish Krone',
+    'price_kwd': 'Kuwaiti Dinar',
+    'price_bhd': 'Bahraini Dinar',
+    'price_omr': 'Omani Rial',
+    'price_qar': 'Qatari Riyal'
+    },
+    'gold_items': {
+        'geram18': '18K Gold (per gram)',
+        'sekeb': 'Emami Gold Coin',
+        'nim': 'Half Emami Gold Coin',
+        'rob': 'Quarter Emami Gold Coin',
+        'geram24': '24K Gold (per gram)'
+    },
+    'crypto_ids': {  # ✅ NEW
+        'bitcoin': 'Bitcoin',
+        'ethereum': 'Ethereum',
+        'tether': 'Tether',
+        'dogecoin': 'Dogecoin',
+        'litecoin': 'Litecoin'
+    }
+
+}
+
+
+def _pyplot():
+    """Import pyplot on first use; the bot never draws charts, so it never pays for it"""
+    import matplotlib
+    matplotlib.use('Agg')  # Charts are only ever saved to files
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def ttl_cached(key: str):
+    """Serve a fetcher method from the instance TTL cache under the given key"""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self):
+            # Per-key lock: concurrent requests for the same data wait for one fetch
+            with self._cache_locks[key]:
+                with self._cache_lock:
+                    cached = self._cache.get(key)
+                if cached is not None:
+                    return cached
+
+                result = method(self)
+                if result:
+                    with self._cache_lock:
+                        self._cache[key] = result
+                return result
+        return wrapper
+    return decorator
+
+
+class FinancialDataFetcher:
+    def __init__(self):
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': CONFIG['user_agent']})
+        # Keep enough idle keep-alive connections for every concurrent fetch to reuse,
+        # and let urllib3 handle retries with backoff on transient server errors
+        backoff = {}
+        if _RETRY_BACKOFF_OPTIONS:
+            # Jittered, capped exponential backoff keeps parallel retries from hitting TGJU in lockstep
+            backoff = {'backoff_max': CONFIG['retry_delay_max'], 'backoff_jitter': CONFIG['retry_jitter']}
+        adapter = HTTPAdapter(
+            pool_connections=CONFIG['pool_connections'],
+            pool_maxsize=CONFIG['pool_maxsize'],
+            max_retries=Retry(
+                total=CONFIG['max_retries'],
+                backoff_factor=CONFIG['retry_delay'],
+                status_forcelist=[429, 500, 502, 503, 504],
+                **backoff
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.tehran_timezone = pytz.timezone('Asia/Tehran')
+        self._cache = TTLCache(maxsize=8, ttl=CONFIG['cache_ttl'])
+        self._cache_lock = Lock()
+        self._cache_locks = {key: Lock() for key in ('currencies', 'gold', 'crypto')}
+        self._executor = ThreadPoolExecutor(max_workers=CONFIG['max_workers'], thread_name_prefix='tgju')
+
+    def _make_request(self, url: str, params: Optional[Dict] = None) -> Optional[lxml.html.HtmlElement]:
+        try:
+            with self.session.get(
+                url,
+                params=params,
+                timeout=CONFIG['timeout'],
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                # Parse chunks as they arrive instead of buffering and decoding the whole page first
+                parser = lxml.html.HTMLParser(encoding=response.encoding)
+                for chunk in response.iter_content(chunk_size=8192):
+                    parser.feed(chunk)
+                return parser.close()
+        except (requests.exceptions.RequestException, lxml.etree.LxmlError) as e:
+            logger.warning(f"Request failed for {url}: {str(e)}")
+            return None
+
+    @ttl_cached('crypto')
+    def fetch_crypto(self) -> Dict:
+        """Fetch cryptocurrency prices via TGJU's JSON API"""
+        logger.info("Fetching cryptocurrency prices via TGJU API...")
+        url = "https://api.tgju.org/v1/market/dataservice/crypto-assets?type=performance"
+        try:
+            response = self.session.get(url, timeout=CONFIG['timeout'])
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+
+            timestamp = self._get_current_time()
+            cryptos = {}
+            for entry in result.get('data', []):
+                sym = entry.get('symbol')
+                if not sym:
+                    continue
+                name = sym  # or map symbol to full name if preferred
+
+                price_irr = parse_price(entry.get('p_irr') or entry.get('p'))
+                change = entry.get('dp') or entry.get('d')
+
+                cryptos[name] = {
+                    'price_irr': price_irr,
+                    'change': f"{change}",
+                    'timestamp': timestamp
+                }
+            return cryptos
+
+        except Exception as e:
+            logger.error(f"Failed to fetch crypto: {e}")
+            return {}
+
+    @ttl_cached('currencies')
+    def fetch_currencies(self) -> Dict:
+        """Fetch currency rates via TGJU's JSON API, falling back to the HTML page"""
+        logger.info("Fetching currency rates via TGJU API...")
+        url = "https://api.tgju.org/v1/market/indicator/summary-table-data/price"
+        try:
+            response = self.session.get(url, timeout=CONFIG['timeout'])
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+
+            entries = {entry.get('name'): entry for entry in result.get('data', [])}
+
+            timestamp = self._get_current_time()
+            currencies = {}
+            for currency_id, name in CONFIG['currency_ids'].items():
+                entry = entries.get(currency_id)
+                if not entry:
+                    continue
+
+                price_irr = parse_price(entry.get('p_irr') or entry.get('p'))
+                change = entry.get('dp') or entry.get('d')
+
+                currencies[name] = {
+                    'price_irr': price_irr,
+                    'change': f"{change}",
+                    'timestamp': timestamp
+                }
+            if currencies:
+                return currencies
+            logger.warning("Currency API returned no known symbols, falling back to HTML page")
+
+        except Exception as e:
+            logger.warning(f"Currency API failed, falling back to HTML page: {e}")
+
+        return self._fetch_currencies_html()
+
+    def _fetch_currencies_html(self) -> Dict:
+        """Scrape currency rates from the TGJU /currency page"""
+        root = self._make_request(f"{CONFIG['base_url']}/currency")
+        if root is None:
+            return {}
+
+        # Collect every row's first price and change cell from a single tree traversal
+        prices, changes = {}, {}
+        for cell in _CURRENCY_CELLS(root):
+            row_id = cell.getparent().get('data-market-row')
+            column = prices if 'nf' in cell.get('class').split() else changes
+            column.setdefault(row_id, cell.text_content().strip())
+
+        timestamp = self._get_current_time()
+        currencies = {}
+        for currency_id, name in CONFIG['currency_ids'].items():
+            if currency_id not in prices and currency_id not in changes:
+                continue
+
+            currencies[name] = {
+                'price_irr': parse_price(prices.get(currency_id)),
+                'change': changes.get(currency_id, 'N/A'),
+                'timestamp': timestamp
+            }
+        return currencies
+
+    @ttl_cached('gold')
+    def fetch_gold_and_coins(self) -> Dict:
+        """Fetch gold and coin prices via TGJU's JSON API, falling back to the profile pages"""
+        logger.info("Fetching gold and coin prices via TGJU API...")
+        url = "https://api.tgju.org/v1/market/dataservice/gold?type=performance"
+        try:
+            response = self.session.get(url, timeout=CONFIG['timeout'])
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+
+            # One request returns every item, so index it once by item id
+            entries = {entry.get('name'): entry for entry in result.get('data', [])}
+
+            timestamp = self._get_current_time()
+            results = {}
+            for item_id, item_name in CONFIG['gold_items'].items():
+                entry = entries.get(item_id)
+                if not entry:
+                    continue
+
+                price_irr = parse_price(entry.get('p_irr') or entry.get('p'))
+                change = entry.get('dp') or entry.get('d')
+
+                results[item_name] = {
+                    'price_irr': price_irr,
+                    'change': f"{change}",
+                    'timestamp': timestamp
+                }
+            if results:
+                return results
+            logger.warning("Gold API returned no known items, falling back to profile pages")
+
+        except Exception as e:
+            logger.warning(f"Gold API failed, falling back to profile pages: {e}")
+
+        return self._fetch_gold_html()
+
+    def _fetch_gold_html(self) -> Dict:
+        """Scrape gold and coin prices from each item's TGJU /profile page"""
+        def fetch_item(item_id):
+            root = self._make_request(f"{CONFIG['base_url']}/profile/{item_id}")
+            if root is None:
+                return None
+
+            price, change = None, 'N/A'
+            for cell in _PROFILE_CELLS(root):
+                if 'value' in cell.get('class').split():
+                    price = cell.text_content().strip()
+                else:
+                    change = cell.text_content().strip()
+            return parse_price(price), change
+
+        # Its own short-lived pool: this can run inside fetch_all's pool, and waiting on that
+        # pool from one of its own workers could deadlock
+        items = CONFIG['gold_items']
+        with ThreadPoolExecutor(max_workers=len(items)) as executor:
+            scraped = list(executor.map(fetch_item, items))
+
+        timestamp = self._get_current_time()
+        results = {}
+        for item_name, item in zip(items.values(), scraped):
+            if item is None:
+                continue
+
+            price_irr, change = item
+            results[item_name] = {
+                'price_irr': price_irr,
+                'change': change,
+                'timestamp': timestamp
+            }
+        return results
+
+    def fetch_all(self) -> Dict:
+        """Fetch all financial data concurrently"""
+        logger.info("Starting to fetch all financial data...")
+        start_time = time.time()
+
+        currencies_future = self._executor.submit(self.fetch_currencies)
+        gold_future = self._executor.submit(self.fetch_gold_and_coins)
+        crypto_future = self._executor.submit(self.fetch_crypto)  # ✅ NEW
+
+        results = {
+            "Foreign Currencies": currencies_future.result(),
+            "Gold & Coins": gold_future.result(),
+            "Cryptocurrencies": crypto_future.result(),  # ✅ NEW
+            "metadata": {
+                "source": "TGJU.ORG",
+                "fetch_time": self._get_current_time(),
+                "execution_time": f"{time.time() - start_time:.2f} seconds"
+            }
+        }
+
+        logger.info("Successfully fetched all financial data")
+        return results
+
+    def close(self):
+        """Shut down the worker threads and release pooled connections"""
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    def _get_current_time(self) -> str:
+        """Get current time in Tehran timezone"""
+        return datetime.now(self.tehran_timezone).strftime("%Y-%m-%d %H:%M:%S %Z%z")
+
+
+
+
+class DataVisualizer:
+    @staticmethod
+    def create_price_chart(data: Dict, category: str, filename: str = None, ax=None):
+        """Create a price chart for a specific category, drawing on ax if one is given"""
+        items = data.get(category, {})
+        if not items:
+            logger.warning(f"No data available for category: {category}")
+            return
+
+        names = [name for name, details in items.items() if details.get('price_irr') is not None]
+        if len(names) < len(items):
+            logger.warning(f"No price available for {len(items) - len(names)} item(s) in {category}")
+
+        if not names:
+            logger.warning("No valid data to plot")
+            return
+
+        import numpy as np
+        plt = _pyplot()
+
+        # Prices are already numeric, so fill a float array directly for matplotlib
+        prices = np.fromiter((items[name]['price_irr'] for name in names), dtype=np.float64, count=len(names))
+
+        # Reuse the caller's axes when drawing several charts in a row
+        owns_figure = ax is None
+        if owns_figure:
+            fig, ax = plt.subplots(figsize=(12, 6))
+        else:
+            fig = ax.figure
+            ax.clear()
+
+        bars = ax.bar(
+            names,
+            prices,
+            color=['gold' if 'Gold' in name or 'Coin' in name else 'skyblue' for name in names]
+        )
+
+        ax.set_title(f'{category} Prices - {data["metadata"]["fetch_time"]}')
+        ax.set_xlabel('Item')
+        ax.set_ylabel('Price (IRR)')
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        ax.grid(axis='y', linestyle='--', alpha=0.7)
+
+        # Add values on top of each bar
+        for bar, height in zip(bars, prices):
+            ax.text(
+                bar.get_x() + bar.get_width() / 2., height,
+                f'{height:,.0f}',
+                ha='center', va='bottom'
+            )
+
+        fig.tight_layout()
+
+        if filename:
+            fig.savefig(filename, dpi=150, bbox_inches='tight')
+            logger.info(f"Chart saved as {filename}")
+        else:
+            plt.show()
+
+        if owns_figure:
+            plt.close(fig)
+
+    @staticmethod
+    def save_price_charts(data: Dict, filenames: Dict[str, str]):
+        """Save one chart per category, redrawing a single shared figure"""
+        plt = _pyplot()
+        fig, ax = plt.subplots(figsize=(12, 6))
+        try:
+            for category, filename in filenames.items():
+                DataVisualizer.create_price_chart(data, category, filename, ax=ax)
+        finally:
+            plt.close(fig)
+
+
+
+class DataExporter:
+    @staticmethod
+    def save_to_json(data: Dict, filename: str):
+        """Save data to JSON file"""
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=4)
+            logger.info(f"Data successfully saved to {filename}")
+        except Exception as e:
+            logger.error(f"Failed to save JSON file: {str(e)}")
+
+    @staticmethod
+    def save_to_csv(data: Dict, filename: str):
+        """Save data to CSV file"""
+        try:
+            with open(filename, 'w', newline='', encoding='utf-8-sig') as f:
+                writer = csv.writer(f)
+                writer.writerow(['category', 'name', 'price_irr', 'change', 'timestamp'])
+                for category, items in data.items():
+                    if category == 'metadata':
+                        continue
+
+                    writer.writerows(
+                        (category, name, details['price_irr'], details['change'], details['timestamp'])
+                        for name, details in items.items()
+                    )
+            logger.info(f"Data successfully saved to {filename}")
+        except Exception as e:
+            logger.error(f"Failed to save CSV file: {str(e)}")
+
+    @staticmethod
+    def save_to_excel(data: Dict, filename: str):
+        """Save data to Excel file"""
+        try:
+            import pandas as pd
+
+            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+                for category, items in data.items():
+                    if category == 'metadata':
+                        continue
+
+                    # Built from columns directly; openpyxl writes cell by cell whatever the dtypes
+                    details = items.values()
+                    df = pd.DataFrame({
+                        'Name': list(items),
+                        'Price (IRR)': [d['price_irr'] for d in details],
+                        'Change': [d['change'] for d in details],
+                        'Timestamp': [d['timestamp'] for d in details]
+                    })
+                    df.to_excel(writer, sheet_name=category[:31], index=False)
+
+            logger.info(f"Data successfully saved to {filename}")
+        except Exception as e:
+            logger.error(f"Failed to save Excel file: {str(e)}")